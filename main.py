@@ -7,23 +7,37 @@ including repositories, analyzers, template renderer, and CLI interface.
 """
 import os
 import sys
+import functools
 from pathlib import Path
 
 # Добавляем корневую директорию проекта в PYTHONPATH
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
-from src.domain.usecases.generate_readme import ReadmeGeneratorUseCase
-from src.infrastructure.repositories.file_repository import FileRepository
-from src.infrastructure.repositories.config_repository import ConfigRepository
-from src.infrastructure.analyzers.project_analyzer import ProjectAnalyzer
-from src.infrastructure.analyzers.technology_analyzer import TechnologyAnalyzer
-from src.infrastructure.analyzers.structure_analyzer import StructureAnalyzer
-from src.infrastructure.templates.template_renderer import TemplateRenderer
 from src.interfaces.cli.commands import CLIHandler, setup_cli_commands, cli
 
 
-def main():
-    """Main application function."""
+def create_readme_generator(use_cache: bool = True):
+    """
+    Creates the README generation use case with all its dependencies.
+    
+    The imports are done here so that commands which do not generate a README
+    start without loading the analyzers and the template engine.
+    
+    Args:
+        use_cache: Whether analysis results of unchanged projects are reused
+    
+    Returns:
+        ReadmeGeneratorUseCase: The configured use case
+    """
+    from src.domain.usecases.generate_readme import ReadmeGeneratorUseCase
+    from src.infrastructure.repositories.file_repository import FileRepository
+    from src.infrastructure.repositories.config_repository import ConfigRepository
+    from src.infrastructure.analyzers.project_analyzer import ProjectAnalyzer
+    from src.infrastructure.analyzers.cached_project_analyzer import CachedProjectAnalyzer
+    from src.infrastructure.analyzers.technology_analyzer import TechnologyAnalyzer
+    from src.infrastructure.analyzers.structure_analyzer import StructureAnalyzer
+    from src.infrastructure.templates.template_renderer import TemplateRenderer
+    
     base_dir = Path(__file__).resolve().parent
     config_path = os.path.join(base_dir, "config.json")
     templates_dir = os.path.join(base_dir, "src", "infrastructure", "templates")
@@ -34,15 +48,33 @@ def main():
     technology_analyzer = TechnologyAnalyzer(file_repository, config_repository)
     structure_analyzer = StructureAnalyzer(file_repository, config_repository)
     project_analyzer = ProjectAnalyzer(technology_analyzer, structure_analyzer, file_repository)
+    if use_cache:
+        project_analyzer = CachedProjectAnalyzer(project_analyzer, file_repository, dependencies=[config_path])
     
     template_renderer = TemplateRenderer(templates_dir, file_repository, config_repository)
     
-    readme_generator = ReadmeGeneratorUseCase(project_analyzer, template_renderer, file_repository)
+    return ReadmeGeneratorUseCase(project_analyzer, template_renderer, file_repository)
+
+
+def clear_caches() -> int:
+    """
+    Clears the compiled template cache and the project analysis cache.
+    
+    Returns:
+        int: The number of removed cache entries
+    """
+    from src.infrastructure.templates.template_renderer import clear_bytecode_cache
+    from src.infrastructure.analyzers.cached_project_analyzer import clear_analysis_cache
     
-    cli_handler = CLIHandler(readme_generator)
-    setup_cli_commands(cli_handler)
+    return clear_bytecode_cache() + clear_analysis_cache()
+
+
+def main():
+    """Main application function."""
+    cli_handler = CLIHandler(create_readme_generator, clear_caches)
+    parser = setup_cli_commands(cli_handler)
     
-    return cli
+    return functools.partial(cli, parser)
 
 
 if __name__ == "__main__":
@@ -1,9 +1,14 @@
 """Module with project entities."""
+import sys
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional
 
 
-@dataclass
+# Slotted dataclasses need Python 3.10; older versions fall back to regular ones.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class Technology:
     """Technology used in the project."""
     name: str
@@ -1,6 +1,6 @@
 """Abstract ports for data access."""
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional, BinaryIO
+from typing import Dict, Iterable, List, Any, Optional, BinaryIO
 
 
 class FileRepositoryPort(ABC):
@@ -19,6 +19,19 @@ class FileRepositoryPort(ABC):
         """
         pass
     
+    @abstractmethod
+    def read_bytes(self, path: str) -> bytes:
+        """
+        Reads the raw content of a file.
+        
+        Args:
+            path: The path to the file.
+        
+        Returns:
+            bytes: The content of the file.
+        """
+        pass
+    
     @abstractmethod
     def save_file(self, path: str, content: str) -> None:
         """
@@ -30,6 +43,17 @@ class FileRepositoryPort(ABC):
         """
         pass
         
+    @abstractmethod
+    def save_stream(self, path: str, chunks: Iterable[str]) -> None:
+        """
+        Saves content produced in chunks to a file.
+        
+        Args:
+            path: The path to the file.
+            chunks: The chunks of content to save, in order.
+        """
+        pass
+    
     @abstractmethod
     def file_exists(self, path: str) -> bool:
         """
@@ -43,6 +67,19 @@ class FileRepositoryPort(ABC):
         """
         pass
         
+    @abstractmethod
+    def exists_many(self, paths: Iterable[str]) -> Dict[str, bool]:
+        """
+        Checks whether several files exist.
+        
+        Args:
+            paths: The paths to the files.
+        
+        Returns:
+            Dict[str, bool]: A mapping of every requested path to its existence flag.
+        """
+        pass
+        
     @abstractmethod
     def list_files(self, path: str, pattern: Optional[str] = None) -> List[str]:
         """
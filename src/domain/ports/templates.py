@@ -1,6 +1,6 @@
 """Abstract ports for working with templates."""
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Optional
 
 
 class TemplateRendererPort(ABC):
@@ -24,6 +24,24 @@ class TemplateRendererPort(ABC):
         """
         pass
     
+    @abstractmethod
+    def render_stream(self, 
+                      template_name: str, 
+                      context: Dict[str, Any],
+                      sections: Optional[List[str]] = None) -> Iterator[str]:
+        """
+        Renders a template with the given context chunk by chunk.
+        
+        Args:
+            template_name: The name of the template.
+            context: The data context to substitute into the template.
+            sections: A list of sections to include (if None, all sections are used).
+        
+        Returns:
+            Iterator[str]: The chunks of the rendered template.
+        """
+        pass
+    
     @abstractmethod
     def get_available_templates(self) -> List[str]:
         """
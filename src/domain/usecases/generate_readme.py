@@ -42,12 +42,12 @@ class ReadmeGeneratorUseCase:
         if not output_path:
             output_path = self.file_repository.join_path(project_path, "README.md")
         
-        readme_content = self.template_renderer.render(
+        readme_chunks = self.template_renderer.render_stream(
             template_name=template_name,
             context=project.to_dict(),
             sections=section_names
         )
         
-        self.file_repository.save_file(output_path, readme_content)
+        self.file_repository.save_stream(output_path, readme_chunks)
         
         return output_path 
\ No newline at end of file
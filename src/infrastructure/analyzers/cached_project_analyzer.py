@@ -0,0 +1,279 @@
+"""Project analyzer that reuses results for unchanged projects."""
+import os
+import sys
+import json
+import stat
+import time
+import hashlib
+import dataclasses
+from typing import Dict, Any, Iterable, Optional
+
+from ...domain.ports.analyzers import ProjectAnalyzerPort
+from .project_analyzer import ProjectAnalyzer
+from ...domain.ports.repositories import FileRepositoryPort
+from ...domain.entities.project import Project, Technology, Feature
+
+
+CACHE_FORMAT_VERSION = 3
+ANALYSIS_CACHE_MAX_AGE_DAYS = 30
+ANALYSIS_CACHE_MAX_ENTRIES = 64
+
+README_FILE = "README.md"
+
+def get_analysis_cache_dir() -> str:
+    """
+    Returns the directory for cached analysis results.
+    
+    Returns:
+        str: The path to the cache directory
+    """
+    cache_root = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_root, "readmeforge", "analysis")
+
+
+def purge_analysis_cache(max_age_days: Optional[int] = ANALYSIS_CACHE_MAX_AGE_DAYS,
+                         max_entries: Optional[int] = ANALYSIS_CACHE_MAX_ENTRIES,
+                         cache_dir: Optional[str] = None) -> int:
+    """
+    Deletes cached analysis results that are old or over the entry limit.
+    
+    Args:
+        max_age_days: The age in days after which a cache entry is removed
+            (if None, all entries are removed)
+        max_entries: The number of most recently written entries to keep
+            (if None, the number is not limited)
+        cache_dir: The cache directory (defaults to the user cache directory)
+    
+    Returns:
+        int: The number of removed cache entries
+    """
+    cutoff = None if max_age_days is None else time.time() - max_age_days * 24 * 60 * 60
+    removed = 0
+    kept = []
+    try:
+        with os.scandir(cache_dir or get_analysis_cache_dir()) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json"):
+                    continue
+                try:
+                    mtime = entry.stat().st_mtime
+                    if cutoff is None or mtime < cutoff:
+                        os.remove(entry.path)
+                        removed += 1
+                    else:
+                        kept.append((mtime, entry.path))
+                except OSError:
+                    pass
+    except OSError:
+        pass
+    
+    if max_entries is not None and len(kept) > max_entries:
+        kept.sort(reverse=True)
+        for _, path in kept[max_entries:]:
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError:
+                pass
+    return removed
+
+
+def clear_analysis_cache() -> int:
+    """
+    Deletes all cached analysis results.
+    
+    Returns:
+        int: The number of removed cache entries
+    """
+    return purge_analysis_cache(None)
+
+
+def compute_tree_signature(project_path: str, dependencies: Iterable[str] = ()) -> str:
+    """
+    Computes a signature that changes whenever a file in the project changes.
+    
+    The path of every entry in the tree is hashed, together with the modification
+    time and size of every file, so edits, renames, additions and removals all
+    change the signature. No
+    directory is skipped, because some analyzers read files anywhere in the
+    project, and symlinks are followed like the structure analyzer does, with
+    each directory visited once. README.md in the project root only contributes
+    its name, because generating a README rewrites it; the description read
+    from it is detected again on every cache hit.
+    
+    Args:
+        project_path: The path to the project root
+        dependencies: Extra files that affect the analysis
+    
+    Returns:
+        str: The signature
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{CACHE_FORMAT_VERSION}\0{os.path.abspath(project_path)}\n".encode("utf-8", "surrogateescape"))
+    
+    try:
+        root = os.stat(project_path)
+        visited = {(root.st_dev, root.st_ino)}
+    except OSError:
+        visited = set()
+    
+    stack = [project_path]
+    while stack:
+        path = stack.pop()
+        try:
+            with os.scandir(path) as entries:
+                entries = sorted(entries, key=lambda entry: entry.name)
+        except OSError:
+            continue
+        
+        for entry in entries:
+            if path == project_path and entry.name == README_FILE:
+                digest.update(f"{entry.path}\n".encode("utf-8", "surrogateescape"))
+                continue
+            try:
+                info = entry.stat()
+            except OSError:
+                try:
+                    info = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+            if stat.S_ISDIR(info.st_mode):
+                digest.update(f"{entry.path}/\n".encode("utf-8", "surrogateescape"))
+                key = (info.st_dev, info.st_ino)
+                if key not in visited:
+                    visited.add(key)
+                    stack.append(entry.path)
+            else:
+                digest.update(f"{entry.path}\0{info.st_mtime_ns}\0{info.st_size}\n".encode("utf-8", "surrogateescape"))
+    
+    for path in dependencies:
+        try:
+            digest.update(f"{path}\0{os.stat(path).st_mtime_ns}\n".encode("utf-8", "surrogateescape"))
+        except OSError:
+            digest.update(f"{path}\n".encode("utf-8", "surrogateescape"))
+    
+    return digest.hexdigest()
+
+
+class CachedProjectAnalyzer(ProjectAnalyzerPort):
+    """Project analyzer that stores results on disk and reuses them while the project is unchanged."""
+    
+    def __init__(self,
+                 project_analyzer: ProjectAnalyzer,
+                 file_repository: FileRepositoryPort,
+                 cache_dir: Optional[str] = None,
+                 dependencies: Iterable[str] = ()):
+        """
+        Initializes the cached project analyzer.
+        
+        Args:
+            project_analyzer: The analyzer used when there is no valid cached result;
+                it also detects the README-derived description on cache hits
+            file_repository: The repository for working with files
+            cache_dir: The directory for cached results (defaults to the user cache directory)
+            dependencies: Extra files whose changes invalidate cached results, such as the config file
+        """
+        self.project_analyzer = project_analyzer
+        self.file_repository = file_repository
+        self.cache_dir = cache_dir or get_analysis_cache_dir()
+        self.dependencies = tuple(dependencies)
+    
+    def analyze(self, project_path: str) -> Project:
+        """
+        Analyzes the project and returns a Project object.
+        
+        Args:
+            project_path: The path to the project root
+        
+        Returns:
+            Project: Analyzed project
+        """
+        signature = compute_tree_signature(project_path, self.dependencies)
+        cache_path = self._get_cache_path(project_path)
+        
+        project = self._load(cache_path, signature)
+        if project is not None:
+            project.description = self.project_analyzer.detect_description(project_path)
+            return project
+        
+        project = self.project_analyzer.analyze(project_path)
+        self._store(cache_path, signature, project)
+        return project
+    
+    def _get_cache_path(self, project_path: str) -> str:
+        """
+        Returns the cache file for a project.
+        
+        Args:
+            project_path: The path to the project root
+        
+        Returns:
+            str: The path to the cache file
+        """
+        key = hashlib.blake2b(os.path.abspath(project_path).encode("utf-8"), digest_size=16).hexdigest()
+        return self.file_repository.join_path(self.cache_dir, f"{key}.json")
+    
+    def _load(self, cache_path: str, signature: str) -> Optional[Project]:
+        """
+        Loads a cached result if it matches the signature.
+        
+        Args:
+            cache_path: The path to the cache file
+            signature: The current signature of the project tree
+        
+        Returns:
+            Optional[Project]: The cached project or None if there is no valid result
+        """
+        if not self.file_repository.file_exists(cache_path):
+            return None
+        
+        try:
+            data = json.loads(self.file_repository.read_bytes(cache_path))
+            if data.get("signature") != signature:
+                return None
+            return self._project_from_dict(data["project"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+    
+    def _store(self, cache_path: str, signature: str, project: Project) -> None:
+        """
+        Stores a result in the cache. Failures are ignored.
+        
+        Old entries are aged out at the same time, and the cache directory is
+        kept within ANALYSIS_CACHE_MAX_ENTRIES.
+        
+        Args:
+            cache_path: The path to the cache file
+            signature: The signature of the project tree
+            project: The analyzed project
+        """
+        try:
+            content = json.dumps({"signature": signature, "project": dataclasses.asdict(project)})
+            self.file_repository.save_file(cache_path, content)
+        except (OSError, TypeError, ValueError):
+            pass
+        
+        purge_analysis_cache(cache_dir=self.cache_dir)
+    
+    def _project_from_dict(self, data: Dict[str, Any]) -> Project:
+        """
+        Restores a Project from its cached form.
+        
+        Args:
+            data: The cached project data
+        
+        Returns:
+            Project: The restored project
+        """
+        return Project(
+            name=data["name"],
+            path=data["path"],
+            description=data.get("description", ""),
+            technologies=[
+                Technology(**dict(tech, category=sys.intern(tech["category"])))
+                for tech in data.get("technologies", [])
+            ],
+            features=[Feature(**feature) for feature in data.get("features", [])],
+            structure=data.get("structure", {}),
+            metadata=data.get("metadata", {})
+        )
@@ -1,6 +1,7 @@
 """Main project analyzer."""
 import os
 import re
+import sys
 from typing import Dict, List, Any, Optional
 
 from ...domain.ports.analyzers import ProjectAnalyzerPort, TechnologyAnalyzerPort, StructureAnalyzerPort
@@ -131,6 +132,21 @@ class ProjectAnalyzer(ProjectAnalyzerPort):
         
         return os.path.basename(os.path.normpath(project_path))
     
+    def detect_description(self, project_path: str) -> str:
+        """
+        Determines the project description on its own.
+        
+        The description may be read from README.md, which changes whenever a README
+        is generated, so callers that reuse an earlier analysis detect it again.
+        
+        Args:
+            project_path: The path to the project root
+            
+        Returns:
+            str: Project description
+        """
+        return self._detect_project_description(project_path)
+    
     def _detect_project_description(self, project_path: str) -> str:
         """
         Determines the project description.
@@ -463,6 +479,7 @@ class ProjectAnalyzer(ProjectAnalyzerPort):
         result = []
         
         for category, items in tech_data.items():
+            category = sys.intern(category)
             for item in items:
                 tech = Technology(
                     name=item.get("name", ""),
@@ -78,35 +78,33 @@ class StructureAnalyzer(StructureAnalyzerPort):
             "children": []
         }
         
+        dir_suffixes = tuple(pattern[1:] for pattern in ignored_dirs if pattern.startswith('*'))
+        file_suffixes = tuple(pattern[1:] for pattern in ignored_files if pattern.startswith('*'))
+        
         try:
-            items = os.listdir(path)
-            
             directories = []
             files = []
             
-            for item in items:
-                item_path = os.path.join(path, item)
-                
-                if os.path.isdir(item_path):
-                    if item in ignored_dirs or any(item.endswith(pattern[1:]) for pattern in ignored_dirs if pattern.startswith('*')):
-                        continue
-                    directories.append(item)
-                else:
-                    if item in ignored_files or any(item.endswith(pattern[1:]) for pattern in ignored_files if pattern.startswith('*')):
-                        continue
-                    files.append(item)
-            
-            for directory in sorted(directories):
-                dir_path = os.path.join(path, directory)
-                child = self._build_tree(base_path, dir_path, ignored_dirs, ignored_files, max_depth - 1)
-                result["children"].append(child)
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    item = entry.name
+                    
+                    if entry.is_dir():
+                        if item in ignored_dirs or (dir_suffixes and item.endswith(dir_suffixes)):
+                            continue
+                        directories.append((item, entry.path))
+                    else:
+                        if item in ignored_files or (file_suffixes and item.endswith(file_suffixes)):
+                            continue
+                        files.append(item)
             
-            for file in sorted(files):
-                file_path = os.path.join(path, file)
-                result["children"].append({
-                    "name": file,
-                    "type": "file"
-                })
+            result["children"] = [
+                self._build_tree(base_path, dir_path, ignored_dirs, ignored_files, max_depth - 1)
+                for directory, dir_path in sorted(directories)
+            ] + [
+                {"name": file, "type": "file"}
+                for file in sorted(files)
+            ]
         except Exception as e:
             result["error"] = str(e)
             
@@ -883,9 +883,11 @@ class TechnologyAnalyzer(TechnologyAnalyzerPort):
         """
         project_files_config = self.config_repository.get_config("analyzers.project_files")
         
+        file_paths = {filename: os.path.join(project_path, filename) for filename in project_files_config}
+        existing = self.file_repository.exists_many(file_paths.values())
+        
         for filename, technology in project_files_config.items():
-            file_path = os.path.join(project_path, filename)
-            if self.file_repository.file_exists(file_path):
+            if existing[file_paths[filename]]:
                 category = self._determine_technology_category(technology)
                 self._add_technology_if_not_exists(result, category, technology, 3)
     
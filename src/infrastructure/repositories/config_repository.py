@@ -1,11 +1,104 @@
 """Repository for working with configuration."""
 import json
 import os
+import sys
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Dict, Any, Optional
 
 from ...domain.ports.repositories import ConfigRepositoryPort, FileRepositoryPort
 
 
+def _freeze(config: Dict[str, Any]) -> Mapping:
+    """
+    Builds a read-only view of a nested configuration.
+    
+    Every nested dictionary is wrapped in a MappingProxyType and every list is
+    copied into a tuple once, so callers can read the configuration without
+    defensive copies and cannot corrupt the cache.
+    Keys are interned so repeated lookups with literal keys compare by identity.
+    
+    Args:
+        config: The nested configuration
+    
+    Returns:
+        Mapping: The read-only view of the configuration
+    """
+    return MappingProxyType({
+        sys.intern(key): _freeze_value(value)
+        for key, value in config.items()
+    })
+
+
+def _freeze_value(value: Any) -> Any:
+    """
+    Builds a read-only view of a single configuration value.
+    
+    Args:
+        value: The configuration value
+    
+    Returns:
+        Any: The value itself, or a read-only view for dictionaries and lists
+    """
+    if isinstance(value, dict):
+        return _freeze(value)
+    if isinstance(value, list):
+        return tuple(_freeze_value(item) for item in value)
+    return value
+
+
+def _flatten(config: Mapping, sep: str = ".") -> Dict[str, Any]:
+    """
+    Builds a flat index of a nested configuration.
+    
+    Every value, including nested dictionaries, is stored under its full
+    dotted key, so a lookup is a single hash probe instead of a walk.
+    
+    Args:
+        config: The nested configuration
+        sep: The separator between key parts
+    
+    Returns:
+        Dict[str, Any]: The flat index of the configuration
+    """
+    flat = {}
+    stack = [("", config)]
+    while stack:
+        prefix, current = stack.pop()
+        for key, value in current.items():
+            full_key = sys.intern(f"{prefix}{key}")
+            flat[full_key] = value
+            if isinstance(value, Mapping):
+                stack.append((f"{full_key}{sep}", value))
+    return flat
+
+
+def _deep_update(target: Dict[str, Any], source: Dict[str, Any]) -> None:
+    """
+    Deeply updates the target dictionary with values from the source.
+    
+    Nested dictionaries are walked with an explicit stack instead of recursion;
+    the hot builtins are bound to locals to keep the inner loop tight on large configs.
+    
+    Args:
+        target: Target dictionary
+        source: Dictionary with new values
+    """
+    is_instance = isinstance
+    stack = [(target, source)]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        current_target, current_source = pop()
+        get = current_target.get
+        for key, value in current_source.items():
+            target_value = get(key)
+            if is_instance(target_value, dict) and is_instance(value, dict):
+                push((target_value, value))
+            else:
+                current_target[key] = value
+
+
 class ConfigRepository(ConfigRepositoryPort):
     """Repository for working with configuration."""
     
@@ -13,6 +106,9 @@ class ConfigRepository(ConfigRepositoryPort):
         """
         Initialization of the configuration repository.
         
+        The configuration is loaded eagerly; a missing or invalid file yields an
+        empty configuration, which the next update_config writes over.
+        
         Args:
             config_path: The path to the configuration file
             file_repository: Repository for working with files
@@ -20,11 +116,21 @@ class ConfigRepository(ConfigRepositoryPort):
         self.config_path = config_path
         self.file_repository = file_repository
         self._config_cache = None
+        self._config_view = MappingProxyType({})
+        self._flat_config = {}
+        self._cache_mtime = None
+        
+        try:
+            self._load_config()
+        except (FileNotFoundError, json.JSONDecodeError):
+            self._set_config({})
     
     def get_config(self, key: Optional[str] = None) -> Any:
         """
         Gets the configuration value by key.
         
+        Nested sections are returned as read-only mappings and lists as tuples.
+        
         Args:
             key: The key of the configuration (if None, returns the entire configuration)
         
@@ -33,29 +139,17 @@ class ConfigRepository(ConfigRepositoryPort):
             
         Raises:
             KeyError: If the key is not found in the configuration
-            FileNotFoundError: If the configuration file is not found
             json.JSONDecodeError: If the configuration file has an invalid format
         """
-        if self._config_cache is None:
-            self._load_config()
+        self._refresh_if_stale()
         
         if key is None:
-            return self._config_cache
-        
-        if "." in key:
-            parts = key.split(".")
-            value = self._config_cache
-            for part in parts:
-                if part in value:
-                    value = value[part]
-                else:
-                    raise KeyError(f"Key '{key}' not found in the configuration")
-            return value
-        
-        if key in self._config_cache:
-            return self._config_cache[key]
+            return self._config_view
         
-        raise KeyError(f"Key '{key}' not found in the configuration")
+        try:
+            return self._flat_config[key]
+        except KeyError:
+            raise KeyError(f"Key '{key}' not found in the configuration") from None
     
     def _load_config(self) -> None:
         """
@@ -68,10 +162,45 @@ class ConfigRepository(ConfigRepositoryPort):
         if not self.file_repository.file_exists(self.config_path):
             raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
         
-        content = self.file_repository.read_file(self.config_path)
-        self._config_cache = json.loads(content)
+        mtime = self._get_config_mtime()
+        content = self.file_repository.read_bytes(self.config_path)
+        self._set_config(json.loads(content))
+        self._cache_mtime = mtime
+    
+    def _set_config(self, config: Dict[str, Any]) -> None:
+        """
+        Replaces the cached configuration and rebuilds its read-only view and flat index.
+        
+        Args:
+            config: The new configuration
+        """
+        self._config_cache = config
+        self._config_view = _freeze(config)
+        self._flat_config = _flatten(self._config_view)
+    
+    def _refresh_if_stale(self) -> None:
+        """Reloads the configuration if the file has changed since it was last read or written."""
+        mtime = self._get_config_mtime()
+        if mtime is not None and mtime != self._cache_mtime:
+            self._load_config()
+    
+    def _get_config_mtime(self) -> Optional[int]:
+        """
+        Gets the modification time of the configuration file.
+        
+        A single stat call is much cheaper than re-parsing the file, so it is
+        used to detect writes made by other processes.
+        
+        Returns:
+            Optional[int]: The modification time in nanoseconds or None if the file is missing
+        """
+        try:
+            return os.stat(self.config_path).st_mtime_ns
+        except OSError:
+            return None
     
-    def update_config(self, new_config: Dict[str, Any], merge: bool = True) -> None:
+    def update_config(self, new_config: Dict[str, Any], merge: bool = True,
+                      load_first: bool = True) -> None:
         """
         Updates the configuration.
         
@@ -79,40 +208,56 @@ class ConfigRepository(ConfigRepositoryPort):
             new_config: New configuration values
             merge: If True, merges new values with existing ones,
                    otherwise completely replaces
+            load_first: If True, re-reads a changed configuration file before merging;
+                        pass False when the file contents are about to be overwritten anyway
+        
+        The file is not rewritten if the update leaves the configuration unchanged
+        and the cached configuration is known to match the file.
         """
-        if merge and self._config_cache is None:
+        if merge and load_first:
             try:
-                self._load_config()
-            except (FileNotFoundError, json.JSONDecodeError):
-                self._config_cache = {}
+                self._refresh_if_stale()
+            except json.JSONDecodeError:
+                self._set_config({})
+                self._cache_mtime = None
+        
+        previous_content = None
+        if self._cache_mtime is not None and self._cache_mtime == self._get_config_mtime():
+            previous_content = json.dumps(self._config_cache, indent=2)
         
-        if merge and self._config_cache is not None:
+        if merge:
             self._deep_update(self._config_cache, new_config)
+            self._set_config(self._config_cache)
         else:
-            self._config_cache = new_config
+            self._set_config(new_config)
         
-        self._save_config()
+        content = json.dumps(self._config_cache, indent=2)
+        if content == previous_content:
+            return
+        
+        self._save_config(content)
     
     def _deep_update(self, target: Dict[str, Any], source: Dict[str, Any]) -> None:
         """
-        Recursively updates the target dictionary with values from the source.
+        Deeply updates the target dictionary with values from the source.
         
         Args:
             target: Target dictionary
             source: Dictionary with new values
         """
-        for key, value in source.items():
-            if key in target and isinstance(target[key], dict) and isinstance(value, dict):
-                self._deep_update(target[key], value)
-            else:
-                target[key] = value
+        _deep_update(target, source)
     
-    def _save_config(self) -> None:
+    def _save_config(self, content: Optional[str] = None) -> None:
         """
         Saves the current configuration to a file.
         
+        Args:
+            content: The already serialized configuration (serialized here if None)
+        
         Raises:
             IOError: If an error occurs while writing to a file
         """
-        content = json.dumps(self._config_cache, indent=2)
-        self.file_repository.save_file(self.config_path, content)
\ No newline at end of file
+        if content is None:
+            content = json.dumps(self._config_cache, indent=2)
+        self.file_repository.save_file(self.config_path, content)
+        self._cache_mtime = self._get_config_mtime()
\ No newline at end of file
@@ -1,14 +1,51 @@
 """Repository for working with the file system."""
 import os
+import re
 import glob
-from typing import List, Optional
+import stat
+import fnmatch
+import tempfile
+import functools
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Pattern, Set
 
 from ...domain.ports.repositories import FileRepositoryPort
 
 
+@functools.lru_cache(maxsize=128)
+def _compile_glob(pattern: str) -> Pattern[str]:
+    """
+    Compiles a file name glob pattern into a regular expression.
+    
+    Args:
+        pattern: The glob pattern
+    
+    Returns:
+        Pattern[str]: The compiled regular expression
+    """
+    return re.compile(fnmatch.translate(pattern))
+
+
+@functools.lru_cache(maxsize=None)
+def _default_file_mode() -> int:
+    """
+    Returns the permissions a newly created file gets under the process umask.
+    
+    Returns:
+        int: The file permission bits
+    """
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
 class FileRepository(FileRepositoryPort):
     """Repository for working with the file system."""
     
+    def __init__(self):
+        """Initialization of the file repository."""
+        self._known_dirs: Set[str] = set()
+    
     def read_file(self, path: str) -> str:
         """
         Reads the content of a file.
@@ -23,13 +60,47 @@ class FileRepository(FileRepositoryPort):
             FileNotFoundError: If the file is not found
             IOError: If an error occurs while reading the file
         """
-        with open(path, 'r', encoding='utf-8') as file:
-            return file.read()
+        content = self.read_bytes(path).decode('utf-8')
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return content
+    
+    def read_bytes(self, path: str) -> bytes:
+        """
+        Reads the raw content of a file.
+        
+        The file is read through a raw descriptor with a buffer sized from fstat,
+        bypassing the buffered text IO layers.
+        
+        Args:
+            path: The path to the file
+        
+        Returns:
+            bytes: The content of the file
+            
+        Raises:
+            FileNotFoundError: If the file is not found
+            IOError: If an error occurs while reading the file
+        """
+        fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        try:
+            size = os.fstat(fd).st_size
+            chunks = []
+            chunk = os.read(fd, size or 65536)
+            while chunk:
+                chunks.append(chunk)
+                chunk = os.read(fd, 65536)
+            return b''.join(chunks)
+        finally:
+            os.close(fd)
     
     def save_file(self, path: str, content: str) -> None:
         """
         Saves the content to a file.
         
+        The content is written to a temporary file next to the target and then
+        renamed over it, so a failed write never leaves a truncated file behind.
+        
         Args:
             path: The path to the file
             content: The content to save
@@ -37,10 +108,66 @@ class FileRepository(FileRepositoryPort):
         Raises:
             IOError: If an error occurs while writing to a file
         """
-        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._write_atomic(path, (content.encode('utf-8'),))
+    
+    def save_stream(self, path: str, chunks: Iterable[str]) -> None:
+        """
+        Saves content produced in chunks to a file.
+        
+        Chunks are written as they arrive, so the whole content is never held in
+        memory. The target is replaced only after every chunk has been written.
+        
+        Args:
+            path: The path to the file
+            chunks: The chunks of content to save, in order
+            
+        Raises:
+            IOError: If an error occurs while writing to a file
+        """
+        self._write_atomic(path, (chunk.encode('utf-8') for chunk in chunks))
+    
+    def _write_atomic(self, path: str, chunks: Iterable[bytes]) -> None:
+        """
+        Writes encoded chunks to a temporary file and renames it over the target.
+        
+        The file is written in binary mode, so no newline translation or text
+        encoding happens on each write. The content is flushed to disk before the
+        rename, so a crash leaves either the old or the new file. The temporary
+        file is created next to the target with a unique name, so concurrent
+        writers and existing files are never clobbered. A symlinked target is
+        written through the link, and an existing target keeps its mode.
         
-        with open(path, 'w', encoding='utf-8') as file:
-            file.write(content)
+        Args:
+            path: The path to the file
+            chunks: The encoded chunks to write, in order
+        """
+        if os.path.islink(path):
+            path = os.path.realpath(path)
+        
+        directory = os.path.dirname(path)
+        if directory and directory not in self._known_dirs:
+            os.makedirs(directory, exist_ok=True)
+            self._known_dirs.add(directory)
+        
+        try:
+            mode = stat.S_IMODE(os.stat(path).st_mode)
+        except FileNotFoundError:
+            mode = _default_file_mode()
+        
+        fd, tmp_path = tempfile.mkstemp(dir=directory or os.curdir, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                file.writelines(chunks)
+                file.flush()
+                os.fsync(file.fileno())
+            os.chmod(tmp_path, mode)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
     
     def file_exists(self, path: str) -> bool:
         """
@@ -54,6 +181,41 @@ class FileRepository(FileRepositoryPort):
         """
         return os.path.isfile(path)
     
+    def exists_many(self, paths: Iterable[str]) -> Dict[str, bool]:
+        """
+        Checks whether several files exist.
+        
+        Paths are grouped by their parent directory and every directory is
+        scanned once, instead of issuing a stat call per path. A name that only
+        differs in case from a scanned entry is checked with os.path.isfile, so
+        case-insensitive file systems match the same files as file_exists.
+        
+        Args:
+            paths: The paths to the files
+        
+        Returns:
+            Dict[str, bool]: A mapping of every requested path to True if the file exists
+        """
+        paths_by_dir = defaultdict(list)
+        for path in paths:
+            paths_by_dir[os.path.dirname(path)].append(path)
+        
+        result = {}
+        for directory, dir_paths in paths_by_dir.items():
+            try:
+                with os.scandir(directory or '.') as entries:
+                    present = {entry.name for entry in entries if entry.is_file()}
+            except OSError:
+                present = set()
+            folded = {name.casefold() for name in present}
+            for path in dir_paths:
+                name = os.path.basename(path)
+                if name in present:
+                    result[path] = True
+                else:
+                    result[path] = name.casefold() in folded and os.path.isfile(path)
+        return result
+    
     def list_files(self, path: str, pattern: Optional[str] = None) -> List[str]:
         """
         Gets a list of files in a directory.
@@ -71,12 +233,18 @@ class FileRepository(FileRepositoryPort):
         if not os.path.isdir(path):
             raise NotADirectoryError(f"Path {path} is not a directory")
         
-        if pattern:
-            search_pattern = os.path.join(path, pattern)
-            files = glob.glob(search_pattern)
+        if pattern and ('/' in pattern or os.sep in pattern):
+            files = glob.glob(os.path.join(path, pattern))
+        elif pattern:
+            matcher = _compile_glob(pattern).match
+            include_hidden = pattern.startswith('.')
+            with os.scandir(path) as entries:
+                files = [entry.path for entry in entries
+                         if (include_hidden or not entry.name.startswith('.'))
+                         and matcher(entry.name) and entry.is_file()]
         else:
-            files = [os.path.join(path, f) for f in os.listdir(path) 
-                     if os.path.isfile(os.path.join(path, f))]
+            with os.scandir(path) as entries:
+                files = [entry.path for entry in entries if entry.is_file()]
             
         return files
     
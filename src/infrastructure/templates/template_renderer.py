@@ -1,12 +1,708 @@
 """Module with a class for rendering templates."""
 import os
-from typing import Dict, List, Any, Optional
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+import json
+import time
+import hashlib
+import tempfile
+import functools
+import dataclasses
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Any, Optional, Tuple, Union
+from jinja2 import (
+    BaseLoader, ChoiceLoader, Environment, FileSystemLoader, PackageLoader,
+    FileSystemBytecodeCache, Template, TemplateError
+)
+from jinja2 import nodes
+from jinja2.filters import do_title
+from jinja2.visitor import NodeTransformer
 
 from ...domain.ports.templates import TemplateRendererPort
 from ...domain.ports.repositories import FileRepositoryPort, ConfigRepositoryPort
 
 
+EXCLUDED_DIRS = frozenset([
+    'node_modules', '__pycache__', 'venv', 'env', 'bin', 'obj',
+    '.vs', '.vscode', '.idea', 'dist', 'build', 'target'
+])
+EXCLUDED_FILES = frozenset(['__init__.py', 'Thumbs.db', '.DS_Store'])
+EXCLUDED_EXTS = ('.pdb', '.dll', '.cache')
+
+LANG_TABLE = {
+    "dotnet": {
+        "names": ("C#", ".NET"),
+        "prereqs": (".NET SDK (recommended version 6.0 or later)", "Visual Studio or Visual Studio Code"),
+        "install_cmd": ("dotnet restore", "dotnet build")
+    },
+    "java": {
+        "names": ("Java",),
+        "prereqs": ("JDK (recommended version 11 or later)", "Maven or Gradle build tools"),
+        "install_cmd": ("# Using Maven", "mvn clean install", "", "# Or using Gradle", "./gradlew build")
+    },
+    "kotlin": {
+        "names": ("Kotlin",),
+        "prereqs": ("JDK (recommended version 11 or later)", "Kotlin compiler", "Maven or Gradle build tools"),
+        "install_cmd": ("# Using Maven", "mvn clean install", "", "# Or using Gradle", "./gradlew build")
+    },
+    "python": {
+        "names": ("Python",),
+        "prereqs": ("Python (recommended version 3.8 or later)", "pip (package manager)"),
+        "install_cmd": ("pip install -r requirements.txt",)
+    },
+    "node": {
+        "names": ("Node.js", "JavaScript"),
+        "prereqs": ("Node.js (recommended version 14 or later)", "npm or yarn package manager"),
+        "install_cmd": ("npm install", "# or", "yarn install")
+    },
+    "rust": {
+        "names": ("Rust",),
+        "prereqs": ("Rust and Cargo (recommended version 1.56 or later)",),
+        "install_cmd": ("cargo build",)
+    },
+    "go": {
+        "names": ("Go",),
+        "prereqs": ("Go (recommended version 1.16 or later)",),
+        "install_cmd": ("go mod download",)
+    }
+}
+PREREQUISITES_ORDER = ("dotnet", "java", "kotlin", "python", "node", "rust", "go")
+INSTALL_ORDER = ("python", "node", "rust", "go", "dotnet", "java", "kotlin")
+DEFAULT_INSTALL_CMD = ("# Install dependencies according to your project's requirements",)
+
+COMPONENT_DESCRIPTIONS = {
+    "core": "main business logic",
+    "models": "data models",
+    "model": "data models",
+    "services": "services for working with external systems",
+    "utils": "utility functions and helpers",
+    "helpers": "utility functions and helpers",
+    "config": "project configuration",
+    "controllers": "request handlers and controllers",
+    "views": "view components",
+    "ui": "user interface components",
+    "api": "API endpoints",
+    "db": "database interaction",
+    "database": "database interaction",
+    "tests": "project tests"
+}
+KEY_COMPONENT_DESCRIPTIONS = {
+    "core": "Core business logic",
+    "models": "Data models and entities",
+    "model": "Data models and entities",
+    "services": "Services for working with external systems",
+    "utils": "Utility functions and helpers",
+    "helpers": "Utility functions and helpers",
+    "config": "Project configuration",
+    "controllers": "Request handlers and controllers",
+    "views": "View components",
+    "ui": "User interface components",
+    "api": "API endpoints",
+    "db": "Database interaction",
+    "database": "Database interaction",
+    "tests": "Project tests"
+}
+TOP_LEVEL_DIR_DESCRIPTIONS = {
+    "src": "source code",
+    "tests": "test suite",
+    "test": "test suite",
+    "docs": "documentation",
+    "config": "configuration files",
+    "scripts": "utility scripts",
+    "utils": "utility functions",
+    "helpers": "utility functions",
+    "data": "data access layer",
+    "domain": "domain layer with business logic",
+    "presentation": "presentation layer",
+    "ui": "presentation layer",
+    "resources": "resource files"
+}
+
+DEFAULT_TEMPLATES_DIR = Path(__file__).resolve().parent
+DEFAULTS_MARKER = ".defaults_created"
+
+RENDER_CACHE_SIZE = 64
+
+# Digest of the shipped minimal template; the Python fast path is used only
+# while the loaded template source still matches it.
+MINIMAL_TEMPLATE_DIGEST = "312dc2eefca4a26e19522fc1f9a34650"
+MINIMAL_TECH_HEADINGS = (
+    ("language", "Programming Languages"),
+    ("framework", "Frameworks"),
+    (("frontend", "backend"), "Front-end / Back-end"),
+    ("database", "Database"),
+    ("devops", "DevOps"),
+    ("testing", "Testing"),
+    ("architecture", "Architecture Patterns"),
+    ("other", "Other")
+)
+
+BYTECODE_CACHE_PATTERN = "__jinja2_%s.cache"
+BYTECODE_CACHE_MAX_AGE_DAYS = 30
+BYTECODE_CACHE_ENV = "READMEFORGE_JINJA_CACHE"
+
+
+def get_bytecode_cache_dir() -> str:
+    """
+    Returns the directory for compiled template bytecode.
+    
+    Returns:
+        str: The path to the cache directory
+    """
+    cache_root = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_root, "readmeforge", "jinja")
+
+
+def bytecode_cache_enabled() -> bool:
+    """
+    Checks whether compiled template bytecode should be cached on disk.
+    
+    The cache is enabled unless READMEFORGE_JINJA_CACHE is set to 0, false, no or off.
+    
+    Returns:
+        bool: True if the bytecode cache is enabled
+    """
+    value = os.environ.get(BYTECODE_CACHE_ENV, "")
+    return value.strip().lower() not in ("0", "false", "no", "off")
+
+
+def purge_bytecode_cache(max_age_days: Optional[int] = BYTECODE_CACHE_MAX_AGE_DAYS) -> int:
+    """
+    Deletes compiled template bytecode that has not been written for a while.
+    
+    Args:
+        max_age_days: The age in days after which a cache entry is removed
+            (if None, all entries are removed)
+    
+    Returns:
+        int: The number of removed cache entries
+    """
+    cutoff = None if max_age_days is None else time.time() - max_age_days * 24 * 60 * 60
+    prefix, suffix = BYTECODE_CACHE_PATTERN.split("%s")
+    removed = 0
+    try:
+        with os.scandir(get_bytecode_cache_dir()) as entries:
+            for entry in entries:
+                if not (entry.name.startswith(prefix) and entry.name.endswith(suffix)):
+                    continue
+                try:
+                    if cutoff is None or entry.stat().st_mtime < cutoff:
+                        os.remove(entry.path)
+                        removed += 1
+                except OSError:
+                    pass
+    except OSError:
+        pass
+    return removed
+
+
+def clear_bytecode_cache() -> int:
+    """
+    Deletes all compiled template bytecode.
+    
+    Returns:
+        int: The number of removed cache entries
+    """
+    return purge_bytecode_cache(None)
+
+
+def _is_writable_dir(path: str) -> bool:
+    """
+    Checks whether files can be created in a directory by creating and removing one.
+    
+    Args:
+        path: The path to the directory
+    
+    Returns:
+        bool: True if a file could be created
+    """
+    try:
+        fd, probe_path = tempfile.mkstemp(dir=path, prefix=".probe", suffix=".tmp")
+    except OSError:
+        return False
+    os.close(fd)
+    try:
+        os.remove(probe_path)
+    except OSError:
+        pass
+    return True
+
+
+def _create_bytecode_cache() -> Optional[FileSystemBytecodeCache]:
+    """
+    Creates a bytecode cache so templates are not recompiled on every process start.
+    
+    When the cache directory cannot be written, Jinja's default per-user temporary
+    directory is tried instead; if that is not writable either, caching is disabled.
+    
+    Returns:
+        Optional[FileSystemBytecodeCache]: The bytecode cache or None if it is disabled
+            or unavailable
+    """
+    if not bytecode_cache_enabled():
+        return None
+    
+    cache_dir = get_bytecode_cache_dir()
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+    except OSError:
+        pass
+    
+    if not _is_writable_dir(cache_dir):
+        try:
+            cache = FileSystemBytecodeCache(pattern=BYTECODE_CACHE_PATTERN)
+        except (OSError, RuntimeError):
+            return None
+        return cache if _is_writable_dir(cache.directory) else None
+    
+    purge_bytecode_cache()
+    return FileSystemBytecodeCache(cache_dir, BYTECODE_CACHE_PATTERN)
+
+
+def _create_loader(templates_dir: str) -> BaseLoader:
+    """
+    Creates the template loader for a templates directory.
+    
+    The shipped templates are always resolved through the package loader.
+    A custom templates directory is searched first, so its templates
+    override the shipped ones.
+    
+    Args:
+        templates_dir: The path to the directory with templates
+    
+    Returns:
+        BaseLoader: The template loader
+    """
+    package_loader = PackageLoader(__package__, ".")
+    if Path(templates_dir).resolve() == DEFAULT_TEMPLATES_DIR:
+        return package_loader
+    return ChoiceLoader([FileSystemLoader(templates_dir), package_loader])
+
+
+@functools.lru_cache(maxsize=None)
+def _get_env(templates_dir: str) -> Environment:
+    """
+    Returns the shared Jinja environment for a templates directory.
+    
+    Sharing the environment keeps its compiled-template cache alive across
+    renderer instances. The cache is unbounded and template files are not
+    re-checked for changes, so edits are picked up on the next process start.
+    The exclusion sets are installed as globals once, instead of being copied
+    into every render context.
+    Autoescaping is off because the output is Markdown, not HTML.
+    
+    Args:
+        templates_dir: The path to the directory with templates
+    
+    Returns:
+        Environment: The configured Jinja environment
+    """
+    env = Environment(
+        loader=_create_loader(templates_dir),
+        autoescape=False,
+        trim_blocks=True,
+        lstrip_blocks=True,
+        auto_reload=False,
+        cache_size=-1,
+        bytecode_cache=_create_bytecode_cache()
+    )
+    env.globals["EXCLUDED_DIRS"] = EXCLUDED_DIRS
+    env.globals["EXCLUDED_FILES"] = EXCLUDED_FILES
+    env.globals["EXCLUDED_EXTS"] = EXCLUDED_EXTS
+    return env
+
+
+class _SectionFolder(NodeTransformer):
+    """Folds `{% if %}` branches that only depend on which sections are included."""
+    
+    def __init__(self, sections: FrozenSet[str]):
+        """
+        Initialization of the section folder.
+        
+        Args:
+            sections: The sections included in the render
+        """
+        self.sections = sections
+    
+    def visit_If(self, node: nodes.If) -> Union[nodes.If, List[nodes.Node]]:
+        """
+        Drops the branches of an if block that can never be taken.
+        
+        Args:
+            node: The if node
+        
+        Returns:
+            Union[nodes.If, List[nodes.Node]]: The simplified node or the nodes of the
+            only branch left
+        """
+        branches = [(node.test, node.body)] + [(elif_.test, elif_.body) for elif_ in node.elif_]
+        else_ = node.else_
+        kept = []
+        for test, body in branches:
+            test = self._fold(test)
+            if test is False:
+                continue
+            if test is True:
+                else_ = body
+                break
+            kept.append((test, body))
+        
+        else_ = self._visit_nodes(else_)
+        if not kept:
+            return else_
+        
+        (test, body), rest = kept[0], kept[1:]
+        return nodes.If(
+            test,
+            self._visit_nodes(body),
+            [nodes.If(t, self._visit_nodes(b), [], [], lineno=t.lineno) for t, b in rest],
+            else_,
+            lineno=node.lineno
+        )
+    
+    def _visit_nodes(self, body: List[nodes.Node]) -> List[nodes.Node]:
+        """
+        Transforms a list of nodes, splicing in the branches of folded if blocks.
+        
+        Args:
+            body: The nodes to transform
+        
+        Returns:
+            List[nodes.Node]: The transformed nodes
+        """
+        result = []
+        for child in body:
+            child = self.visit(child)
+            if isinstance(child, nodes.Node):
+                result.append(child)
+            else:
+                result.extend(child)
+        return result
+    
+    def _fold(self, test: nodes.Expr) -> Union[bool, nodes.Expr]:
+        """
+        Evaluates the parts of a condition that test section membership.
+        
+        Args:
+            test: The condition
+        
+        Returns:
+            Union[bool, nodes.Expr]: The value of the condition if it is known,
+            otherwise the condition with the known parts removed
+        """
+        if (isinstance(test, nodes.Compare) and len(test.ops) == 1
+                and isinstance(test.expr, nodes.Const) and isinstance(test.expr.value, str)
+                and isinstance(test.ops[0].expr, nodes.Name) and test.ops[0].expr.name == "sections"
+                and test.ops[0].op in ("in", "notin")):
+            included = test.expr.value in self.sections
+            return included if test.ops[0].op == "in" else not included
+        
+        if isinstance(test, nodes.Not):
+            value = self._fold(test.node)
+            return not value if isinstance(value, bool) else nodes.Not(value, lineno=test.lineno)
+        
+        if isinstance(test, (nodes.And, nodes.Or)):
+            short_circuit = isinstance(test, nodes.Or)
+            left = self._fold(test.left)
+            if left is short_circuit:
+                return short_circuit
+            right = self._fold(test.right)
+            if left is not short_circuit and isinstance(left, bool):
+                return right
+            if right is short_circuit:
+                return short_circuit
+            if isinstance(right, bool):
+                return left
+            return type(test)(left, right, lineno=test.lineno)
+        
+        return self.generic_visit(test)
+
+
+def _specialize_template(env: Environment, template_path: str, sections: FrozenSet[str],
+                         persist: bool = False) -> Template:
+    """
+    Compiles a variant of a template with the section checks already resolved.
+    
+    A persisted variant goes through the bytecode cache under its own name, so
+    later processes load it without parsing the template again; a failed cache
+    write is ignored. Other variants are only compiled in memory, which keeps
+    the number of cache files bounded.
+    
+    Args:
+        env: The Jinja environment
+        template_path: The path of the template inside the loader
+        sections: The sections included in the render
+        persist: Whether the variant is stored in the bytecode cache
+    
+    Returns:
+        Template: The specialized template
+    """
+    source, filename, uptodate = env.loader.get_source(env, template_path)
+    name = f"{template_path}?sections={','.join(sorted(sections))}"
+    
+    bucket = None
+    code = None
+    if persist and env.bytecode_cache is not None:
+        bucket = env.bytecode_cache.get_bucket(env, name, filename, source)
+        code = bucket.code
+    
+    if code is None:
+        ast = _SectionFolder(sections).visit(env.parse(source, template_path, filename))
+        ast.set_environment(env)
+        code = env.compile(ast, template_path, filename)
+        if bucket is not None:
+            bucket.code = code
+            try:
+                env.bytecode_cache.set_bucket(bucket)
+            except OSError:
+                pass
+    
+    return env.template_class.from_code(env, code, env.make_globals(None), uptodate)
+
+
+def render_tree(root_name: str, 
+                children: List[Dict[str, Any]],
+                excluded_dirs: FrozenSet[str] = EXCLUDED_DIRS,
+                excluded_files: FrozenSet[str] = EXCLUDED_FILES,
+                excluded_exts: Tuple[str, ...] = EXCLUDED_EXTS) -> str:
+    """
+    Renders a project tree as the text shown in the Project Structure section.
+    
+    Hidden entries, excluded directories and excluded files are skipped.
+    
+    Args:
+        root_name: The name shown on the first line
+        children: The child nodes of the tree root
+        excluded_dirs: Lowercase directory names to skip
+        excluded_files: File names to skip
+        excluded_exts: File extensions to skip
+    
+    Returns:
+        str: The rendered tree without a trailing newline
+    """
+    lines = [f"{root_name}/"]
+    stack = [(child, 0) for child in reversed(children)]
+    while stack:
+        item, depth = stack.pop()
+        name = item["name"]
+        if name.startswith("."):
+            continue
+        
+        if item["type"] == "directory":
+            if name.lower() in excluded_dirs:
+                continue
+            lines.append(f"{'    ' * depth}├── {name}/")
+            stack.extend((child, depth + 1) for child in reversed(item.get("children", [])))
+        elif item["type"] == "file":
+            if name in excluded_files or name.endswith(excluded_exts):
+                continue
+            lines.append(f"{'    ' * depth}├── {name}")
+    
+    return "\n".join(lines)
+
+
+def _select_language_entry(order: Tuple[str, ...], tech_names: FrozenSet[str]) -> Optional[Dict[str, Any]]:
+    """
+    Picks the first language table entry that matches the project technologies.
+    
+    Args:
+        order: The LANG_TABLE keys in order of priority
+        tech_names: The names of the project technologies
+    
+    Returns:
+        Optional[Dict[str, Any]]: The matching entry or None
+    """
+    for key in order:
+        entry = LANG_TABLE[key]
+        if not tech_names.isdisjoint(entry["names"]):
+            return entry
+    return None
+
+
+def _lookup(obj: Any, key: str) -> Any:
+    """
+    Reads an attribute or item the way a Jinja `obj.key` expression does.
+    
+    Args:
+        obj: The object to read from
+        key: The attribute or item name
+    
+    Returns:
+        Any: The value or None if it is missing
+    """
+    try:
+        return getattr(obj, key)
+    except AttributeError:
+        pass
+    try:
+        return obj[key]
+    except (TypeError, LookupError):
+        return None
+
+
+def _render_minimal(context: Dict[str, Any]) -> str:
+    """
+    Renders the shipped minimal template without Jinja.
+    
+    The output matches minimal/base.md.j2 exactly; MINIMAL_TEMPLATE_DIGEST has
+    to be updated together with both.
+    
+    Args:
+        context: The enhanced template context
+    
+    Returns:
+        str: The rendered README
+    """
+    name = context.get("name")
+    name_text = "" if name is None and "name" not in context else str(name)
+    sections = context["sections"]
+    metadata = context.get("metadata")
+    features = context.get("features") or []
+    categories = context["categories"]
+    technologies_by_category = context["technologies_by_category"]
+    
+    parts = [f"# {name_text}\n\n## Table of Contents\n\n"]
+    parts.extend(f"- [{title}](#{anchor})\n" for title, anchor in context["toc_entries"])
+    parts.append("\n")
+    
+    if "overview" in sections:
+        parts.append(f"## Overview\n\n{context.get('description', '')}\n\n")
+        if name is not None and "_" in name_text or "-" in name_text:
+            parts.append(f"**{do_title(name_text.replace('_', ' ').replace('-', ' '))}** - ")
+        if features:
+            parts.append(f"a tool for {str(_lookup(features[0], 'description')).lower()}")
+            if len(features) > 1:
+                parts.append(f" and {str(_lookup(features[1], 'description')).lower()}")
+            parts.append(".\n")
+        elif context.get("primary_language"):
+            parts.append(f"This project is built with {context['primary_language']['name']}.\n")
+        parts.append("\n")
+        if _lookup(metadata, "has_documentation"):
+            parts.append("Documentation is available in the project directory.\n")
+    parts.append("\n")
+    
+    if "technologies" in sections:
+        parts.append("## Technologies\n\n")
+        for index, (category, heading) in enumerate(MINIMAL_TECH_HEADINGS):
+            if index:
+                parts.append("\n")
+            if isinstance(category, tuple):
+                if categories.isdisjoint(category):
+                    continue
+                parts.append(f"### {heading}\n")
+                for key, label in zip(category, ("Front-end", "Back-end")):
+                    for tech in technologies_by_category.get(key, ()):
+                        version = f" ({tech['version']})" if tech.get("version") else ""
+                        parts.append(f"- **{tech['name']}** ({label}){version}\n")
+            elif category in categories:
+                parts.append(f"### {heading}\n")
+                for tech in technologies_by_category.get(category, ()):
+                    version = f" ({tech['version']})" if tech.get("version") else ""
+                    parts.append(f"- **{tech['name']}**{version}\n")
+    parts.append("\n")
+    
+    if "project_structure" in sections and context.get("structure"):
+        parts.append(f"## Project Structure\n\n```\n{context['project_tree']}\n```\n\n")
+    parts.append("\n")
+    
+    if "installation" in sections:
+        repository_url = _lookup(metadata, "repository_url") or "[repository-url]"
+        parts.append(
+            "## Installation\n\n"
+            f"1. Clone the repository: `git clone {repository_url}`\n"
+            f"2. Navigate to the project directory: `cd {name_text}`\n"
+            "3. Install dependencies and build the project.\n"
+        )
+    parts.append("\n")
+    
+    if "usage" in sections:
+        parts.append("## Usage\n\nRun the application using the instructions relevant to your project type.\n")
+    
+    return "".join(parts)
+
+
+@functools.lru_cache(maxsize=64)
+def _toc_entries(sections: Tuple[str, ...]) -> List[Tuple[str, str]]:
+    """
+    Builds the table of contents titles and anchors for a list of sections.
+    
+    Args:
+        sections: The sections to include
+    
+    Returns:
+        List[Tuple[str, str]]: Pairs of section title and anchor
+    """
+    return [
+        (do_title(section).replace("_", " "), section.lower().replace("_", "-"))
+        for section in sections
+        if section != "table_of_contents"
+    ]
+
+
+def _technology_to_dict(tech: Any) -> Dict[str, Any]:
+    """
+    Converts a technology to the plain dict form used by the templates.
+    
+    Args:
+        tech: A Technology object or a dict with the same keys
+    
+    Returns:
+        Dict[str, Any]: The technology as a dict
+    """
+    if isinstance(tech, dict):
+        return tech
+    return {
+        "name": tech.name,
+        "category": tech.category,
+        "version": getattr(tech, "version", None),
+        "importance": getattr(tech, "importance", 1)
+    }
+
+
+def _to_json_compatible(value: Any) -> Any:
+    """
+    Converts context values that json cannot serialize natively.
+    
+    Args:
+        value: The value to convert
+    
+    Returns:
+        Any: A JSON-serializable representation of the value
+    
+    Raises:
+        TypeError: If the value cannot be represented
+    """
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _render_cache_key(template_name: str, context: Dict[str, Any],
+                      sections: List[str]) -> Optional[str]:
+    """
+    Computes a stable key for the render cache.
+    
+    Args:
+        template_name: The name of the template
+        context: The data context to substitute into the template
+        sections: A list of sections to include
+    
+    Returns:
+        Optional[str]: The cache key or None if the context cannot be serialized
+    """
+    try:
+        payload = json.dumps(
+            [template_name, list(sections), context],
+            sort_keys=True,
+            default=_to_json_compatible
+        )
+    except (TypeError, ValueError):
+        return None
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
 class TemplateRenderer(TemplateRendererPort):
     """Class for rendering README templates."""
     
@@ -23,14 +719,82 @@ class TemplateRenderer(TemplateRendererPort):
         self.templates_dir = templates_dir
         self.file_repository = file_repository
         self.config_repository = config_repository
+        self._available_templates = None
+        self._templates_dir_mtimes: Dict[str, int] = {}
+        self._render_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._templates: Dict[Any, Template] = {}
+        self._sections_cache: Dict[str, List[str]] = {}
+        self._sections_config = None
+        self._minimal_fast_path: Optional[bool] = None
         self._ensure_templates_dir_exists()
         
-        self.env = Environment(
-            loader=FileSystemLoader(templates_dir),
-            autoescape=select_autoescape(['html', 'md']),
-            trim_blocks=True,
-            lstrip_blocks=True
-        )
+        self.env = _get_env(templates_dir)
+        self.precompile_templates()
+    
+    def precompile_templates(self) -> None:
+        """
+        Compiles every available template ahead of the first render.
+        
+        Compiled templates land in the environment cache and the bytecode cache,
+        so the first render does not pay the compile cost. The warm-up is best-effort:
+        templates that fail to compile or to be cached are skipped here and any
+        error is reported when they are rendered.
+        """
+        for template_name in self.get_available_templates():
+            if template_name == "minimal" and self._use_minimal_fast_path():
+                continue
+            try:
+                self._get_template(template_name, self.get_sections_for_template(template_name))
+            except (TemplateError, OSError):
+                pass
+    
+    def _use_minimal_fast_path(self) -> bool:
+        """
+        Checks whether the minimal template can be rendered without Jinja.
+        
+        This holds while the minimal template that would be loaded is the
+        shipped one, unchanged.
+        
+        Returns:
+            bool: True if the Python renderer can be used
+        """
+        if self._minimal_fast_path is None:
+            try:
+                source = self.env.loader.get_source(self.env, "minimal/base.md.j2")[0]
+            except TemplateError:
+                self._minimal_fast_path = False
+            else:
+                digest = hashlib.blake2b(source.encode("utf-8"), digest_size=16).hexdigest()
+                self._minimal_fast_path = digest == MINIMAL_TEMPLATE_DIGEST
+        return self._minimal_fast_path
+    
+    def _get_template(self, template_name: str, sections: Optional[Iterable[str]] = None) -> Template:
+        """
+        Returns the compiled template, loading it on first use.
+        
+        When sections are given, a variant of the template with the section checks
+        already resolved is returned, one per distinct set of sections. Only the
+        variant for the configured sections of the template is written to the
+        bytecode cache.
+        
+        Args:
+            template_name: The name of the template
+            sections: The sections included in the render
+        
+        Returns:
+            Template: The compiled template
+        """
+        key = template_name if sections is None else (template_name, frozenset(sections))
+        template = self._templates.get(key)
+        if template is None:
+            template_path = f"{template_name}/base.md.j2"
+            if sections is None:
+                template = self.env.get_template(template_path)
+            else:
+                persist = key[1] == frozenset(self.get_sections_for_template(template_name))
+                template = _specialize_template(self.env, template_path, key[1], persist)
+            self._templates[key] = template
+        return template
     
     def render(self, 
                template_name: str, 
@@ -39,6 +803,10 @@ class TemplateRenderer(TemplateRendererPort):
         """
         Renders a template with the given context.
         
+        Results are cached by a hash of the template name, context and sections,
+        so repeated renders of unchanged input skip Jinja entirely. The shipped
+        minimal template is rendered in Python.
+        
         Args:
             template_name: The name of the template
             context: The data context to substitute into the template
@@ -50,43 +818,203 @@ class TemplateRenderer(TemplateRendererPort):
         Raises:
             ValueError: If the template is not found
         """
-        base_template_path = f"{template_name}/base.md.j2"
+        if sections is None:
+            sections = self.get_sections_for_template(template_name)
+        
+        cache_key = _render_cache_key(template_name, context, sections)
+        if cache_key is not None and cache_key in self._render_cache:
+            self._render_cache.move_to_end(cache_key)
+            return self._render_cache[cache_key]
+        
+        enhanced_context = self._build_context(context, sections)
+        
+        if template_name == "minimal" and self._use_minimal_fast_path():
+            content = _render_minimal(enhanced_context)
+        else:
+            try:
+                template = self._get_template(template_name, sections)
+            except Exception as e:
+                raise ValueError(f"Error loading template {template_name}: {e}")
+            
+            content = template.render(**enhanced_context)
+        
+        if cache_key is not None:
+            self._render_cache[cache_key] = content
+            if len(self._render_cache) > RENDER_CACHE_SIZE:
+                self._render_cache.popitem(last=False)
         
+        return content
+    
+    def render_stream(self, 
+                      template_name: str, 
+                      context: Dict[str, Any],
+                      sections: Optional[List[str]] = None) -> Iterator[str]:
+        """
+        Renders a template with the given context chunk by chunk.
+        
+        The chunks are produced by Jinja as the template is evaluated. The render
+        cache is bypassed, since hashing the context costs more than a single render
+        and a streamed result is never kept whole.
+        
+        Args:
+            template_name: The name of the template
+            context: The data context to substitute into the template
+            sections: A list of sections to include (if None, all sections are used)
+        
+        Returns:
+            Iterator[str]: The chunks of the rendered template
+            
+        Raises:
+            ValueError: If the template is not found
+        """
         if sections is None:
             sections = self.get_sections_for_template(template_name)
         
-        enhanced_context = context.copy()
-        enhanced_context["sections"] = sections
+        if template_name == "minimal" and self._use_minimal_fast_path():
+            return iter((_render_minimal(self._build_context(context, sections)),))
         
         try:
-            template = self.env.get_template(base_template_path)
+            template = self._get_template(template_name, sections)
         except Exception as e:
             raise ValueError(f"Error loading template {template_name}: {e}")
         
-        return template.render(**enhanced_context)
+        return template.generate(**self._build_context(context, sections))
+    
+    def _build_context(self, context: Dict[str, Any], sections: List[str]) -> Dict[str, Any]:
+        """
+        Builds the template context with values precomputed for the templates.
+        
+        Technologies are normalized to plain dicts, which the templates read with
+        subscripts so Jinja takes the direct item lookup instead of the attribute
+        fallback. They are also grouped by category, their names and categories collected
+        into sets and the primary language and database picked once here, instead of the
+        templates filtering the whole list per section. The installation prerequisites
+        and commands are looked up in LANG_TABLE. The top-level src directory and
+        configuration files are looked up once for the same reason, and the project
+        tree is rendered in Python in a single pass.
+        
+        Args:
+            context: The data context to substitute into the template
+            sections: A list of sections to include
+        
+        Returns:
+            Dict[str, Any]: The enhanced context
+        """
+        technologies = [_technology_to_dict(tech) for tech in context.get("technologies", [])]
+        
+        technologies_by_category = {}
+        for tech in technologies:
+            technologies_by_category.setdefault(tech["category"], []).append(tech)
+        
+        enhanced_context = context.copy()
+        enhanced_context["sections"] = sections
+        enhanced_context["toc_entries"] = _toc_entries(tuple(sections))
+        enhanced_context["technologies"] = technologies
+        enhanced_context["technologies_by_category"] = technologies_by_category
+        enhanced_context["categories"] = frozenset(technologies_by_category)
+        enhanced_context["feature_categories"] = frozenset(
+            feature.get("category") if isinstance(feature, dict) else getattr(feature, "category", None)
+            for feature in context.get("features", [])
+        )
+        tech_names = frozenset(tech["name"] for tech in technologies)
+        enhanced_context["tech_names"] = tech_names
+        
+        prerequisites = _select_language_entry(PREREQUISITES_ORDER, tech_names)
+        install = _select_language_entry(INSTALL_ORDER, tech_names)
+        enhanced_context["prerequisites"] = prerequisites["prereqs"] if prerequisites else ()
+        enhanced_context["install_cmd"] = install["install_cmd"] if install else DEFAULT_INSTALL_CMD
+        
+        languages = technologies_by_category.get("language", [])
+        databases = technologies_by_category.get("database", [])
+        enhanced_context["primary_language"] = languages[0] if languages else None
+        enhanced_context["primary_database"] = databases[0] if databases else None
+        
+        tree = (context.get("structure") or {}).get("tree") or {}
+        children = tree.get("children", [])
+        root_names = {item.get("name") for item in children}
+        src_dir = next((item for item in children if item.get("name") == "src"), None)
+        enhanced_context["src_dir"] = src_dir
+        enhanced_context["src_dirs"] = [
+            item["name"] for item in (src_dir or {}).get("children", []) if item.get("type") == "directory"
+        ]
+        enhanced_context["top_level_dirs"] = [
+            item["name"] for item in children
+            if item.get("type") == "directory"
+            and not item["name"].startswith(".")
+            and item["name"].lower() not in EXCLUDED_DIRS
+        ]
+        enhanced_context["has_config_json"] = "config.json" in root_names
+        enhanced_context["has_env"] = ".env" in root_names
+        enhanced_context["has_appsettings"] = "appsettings.json" in root_names
+        enhanced_context["project_tree"] = render_tree(context.get("name", ""), children)
+        
+        enhanced_context["component_descriptions"] = COMPONENT_DESCRIPTIONS
+        enhanced_context["key_component_descriptions"] = KEY_COMPONENT_DESCRIPTIONS
+        enhanced_context["top_level_dir_descriptions"] = TOP_LEVEL_DIR_DESCRIPTIONS
+        return enhanced_context
     
     def get_available_templates(self) -> List[str]:
         """
         Returns a list of available templates.
         
+        The result is cached until the modification time of the templates directory
+        or of one of its subdirectories changes, so adding or removing base.md.j2
+        in an existing subdirectory is picked up as well.
+        
         Returns:
             List[str]: A list of available template names
         """
+        if self._available_templates is not None and self._templates_dir_unchanged():
+            return list(self._available_templates)
+        
+        try:
+            mtimes = {self.templates_dir: os.stat(self.templates_dir).st_mtime_ns}
+        except FileNotFoundError:
+            return []
+        
         templates = []
         try:
-            for item in os.listdir(self.templates_dir):
-                if os.path.isdir(os.path.join(self.templates_dir, item)):
-                    if os.path.exists(os.path.join(self.templates_dir, item, "base.md.j2")):
-                        templates.append(item)
+            with os.scandir(self.templates_dir) as entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        continue
+                    try:
+                        mtimes[entry.path] = entry.stat().st_mtime_ns
+                    except OSError:
+                        continue
+                    if os.path.exists(os.path.join(entry.path, "base.md.j2")):
+                        templates.append(entry.name)
         except FileNotFoundError:
             pass
-            
-        return templates
+        
+        self._available_templates = templates
+        self._templates_dir_mtimes = mtimes
+        return list(templates)
+    
+    def _templates_dir_unchanged(self) -> bool:
+        """
+        Checks whether the templates directory and its subdirectories are unchanged
+        since the available templates were last listed.
+        
+        Returns:
+            bool: True if no modification time has changed
+        """
+        for path, mtime in self._templates_dir_mtimes.items():
+            try:
+                if os.stat(path).st_mtime_ns != mtime:
+                    return False
+            except OSError:
+                return False
+        return True
     
     def get_sections_for_template(self, template_name: str) -> List[str]:
         """
         Returns a list of sections for the specified template.
         
+        Results are cached per template for as long as the configuration
+        repository returns the same sections mapping; the repository replaces
+        it whenever the configuration is reloaded or updated.
+        
         Args:
             template_name: The name of the template
             
@@ -95,1207 +1023,80 @@ class TemplateRenderer(TemplateRendererPort):
         """
         try:
             sections_config = self.config_repository.get_config("sections")
-            if template_name in sections_config:
-                return sections_config[template_name]
-                
-            return sections_config.get("standard", [])
         except KeyError:
-            return []
+            sections_config = None
+        
+        if sections_config is not self._sections_config:
+            self._sections_cache.clear()
+            self._sections_config = sections_config
+        
+        if template_name in self._sections_cache:
+            return self._sections_cache[template_name]
+        
+        if sections_config is None:
+            sections = []
+        elif template_name in sections_config:
+            sections = sections_config[template_name]
+        else:
+            sections = sections_config.get("standard", [])
+        
+        self._sections_cache[template_name] = sections
+        return sections
     
     def _ensure_templates_dir_exists(self) -> None:
-        """Checks if the templates directory exists and creates it if it doesn't."""
-        if not os.path.exists(self.templates_dir):
-            try:
-                os.makedirs(self.templates_dir)
+        """
+        Creates the templates directory and the default templates if needed.
+        
+        A marker file records that the defaults were created, so later runs
+        do not check every template directory again.
+        """
+        templates_path = Path(self.templates_dir)
+        try:
+            templates_path.mkdir(parents=True, exist_ok=True)
+            if templates_path.resolve() == DEFAULT_TEMPLATES_DIR:
+                return
+            
+            marker = templates_path / DEFAULTS_MARKER
+            if not marker.exists():
                 self._create_default_templates()
-            except OSError as e:
-                print(f"Error creating templates directory: {e}")
+                marker.touch()
+        except OSError as e:
+            print(f"Error creating templates directory: {e}")
     
     def _create_default_templates(self) -> None:
-        """Creates default templates if they don't exist."""
-        self._create_standard_template()
-        
-        self._create_minimal_template()
-        
-        self._create_detailed_template()
+        """Creates default templates if they don't exist, writing them concurrently."""
+        creators = [
+            self._create_standard_template,
+            self._create_minimal_template,
+            self._create_detailed_template
+        ]
+        with ThreadPoolExecutor(max_workers=len(creators)) as executor:
+            list(executor.map(lambda create: create(), creators))
     
     def _create_standard_template(self) -> None:
         """Creates a standard template."""
-        standard_dir = os.path.join(self.templates_dir, "standard")
-        os.makedirs(standard_dir, exist_ok=True)
-        
-        base_path = os.path.join(standard_dir, "base.md.j2")
-        
-        content = """# {{ name }}
-
-## Table of Contents
-
-{% for section in sections %}
-{% if section != "table_of_contents" %}
-- [{{ section|title|replace("_", " ") }}](#{{ section|lower|replace("_", "-") }})
-{% endif %}
-{% endfor %}
-
-{% if "overview" in sections %}
-## Overview
-
-{{ description }}
-
-{% if name is defined and '_' in name or '-' in name %}
-**{{ name|replace('_', ' ')|replace('-', ' ')|title }}** - {% endif %}{% if features|length > 0 %}a tool for {{ features[0].description|lower }}{% if features|length > 1 %} and {{ features[1].description|lower }}{% endif %}.
-{% else %}
-{% if technologies|selectattr('category', 'equalto', 'language')|list|length > 0 %}
-This project is built with {{ technologies|selectattr('category', 'equalto', 'language')|list|first|attr('name') }}.
-{% endif %}
-{% endif %}
-
-{% if metadata.has_documentation %}
-Documentation is available in the project directory.
-{% endif %}
-{% endif %}
-
-{% if "features" in sections and features %}
-## Features
-
-{% for feature in features %}
-### {{ feature.name }}
-
-{{ feature.description }}
-
-{% endfor %}
-{% endif %}
-
-{% if "technologies" in sections %}
-## Technologies
-
-{% if technologies|selectattr('category', 'equalto', 'language')|list|length > 0 %}
-### Programming Languages
-{% for tech in technologies|selectattr('category', 'equalto', 'language')|list %}
-- **{{ tech.name }}**{% if tech.version %} ({{ tech.version }}){% endif %}
-
-{% endfor %}
-{% endif %}
-
-{% if technologies|selectattr('category', 'equalto', 'framework')|list|length > 0 %}
-### Frameworks
-{% for tech in technologies|selectattr('category', 'equalto', 'framework')|list %}
-- **{{ tech.name }}**{% if tech.version %} ({{ tech.version }}){% endif %}
-
-{% endfor %}
-{% endif %}
-
-{% if technologies|selectattr('category', 'equalto', 'frontend')|list|length > 0 or technologies|selectattr('category', 'equalto', 'backend')|list|length > 0 %}
-### Front-end / Back-end
-{% for tech in technologies|selectattr('category', 'equalto', 'frontend')|list %}
-- **{{ tech.name }}** (Front-end){% if tech.version %} ({{ tech.version }}){% endif %}
-
-{% endfor %}
-{% for tech in technologies|selectattr('category', 'equalto', 'backend')|list %}
-- **{{ tech.name }}** (Back-end){% if tech.version %} ({{ tech.version }}){% endif %}
-
-{% endfor %}
-{% endif %}
-
-{% if technologies|selectattr('category', 'equalto', 'database')|list|length > 0 %}
-### Database
-{% for tech in technologies|selectattr('category', 'equalto', 'database')|list %}
-- **{{ tech.name }}**{% if tech.version %} ({{ tech.version }}){% endif %}
-
-{% endfor %}
-{% endif %}
-
-{% if technologies|selectattr('category', 'equalto', 'devops')|list|length > 0 %}
-### DevOps
-{% for tech in technologies|selectattr('category', 'equalto', 'devops')|list %}
-- **{{ tech.name }}**{% if tech.version %} ({{ tech.version }}){% endif %}
-
-{% endfor %}
-{% endif %}
-
-{% if technologies|selectattr('category', 'equalto', 'testing')|list|length > 0 %}
-### Testing
-{% for tech in technologies|selectattr('category', 'equalto', 'testing')|list %}
-- **{{ tech.name }}**{% if tech.version %} ({{ tech.version }}){% endif %}
-
-{% endfor %}
-{% endif %}
-
-{% if technologies|selectattr('category', 'equalto', 'architecture')|list|length > 0 %}
-### Architecture Patterns
-{% for tech in technologies|selectattr('category', 'equalto', 'architecture')|list %}
-- **{{ tech.name }}**{% if tech.version %} ({{ tech.version }}){% endif %}
-
-{% endfor %}
-{% endif %}
-
-{% if technologies|selectattr('category', 'equalto', 'other')|list|length > 0 %}
-### Other
-{% for tech in technologies|selectattr('category', 'equalto', 'other')|list %}
-- **{{ tech.name }}**{% if tech.version %} ({{ tech.version }}){% endif %}
-
-{% endfor %}
-{% endif %}
-{% endif %}
-
-{% if "architecture" in sections %}
-## Architecture
-
-{% if metadata.architecture_description is defined %}
-{{ metadata.architecture_description }}
-{% endif %}
-
-{% if technologies|selectattr('category', 'equalto', 'architecture')|list|length > 0 %}
-This project uses the following architectural approaches:
-{% for tech in technologies|selectattr('category', 'equalto', 'architecture')|list %}
-- **{{ tech.name }}**
-{% endfor %}
-{% endif %}
-
-{% if structure.tree.children|selectattr("name", "equalto", "src")|list|length > 0 %}
-{% set src_structure = structure.tree.children|selectattr("name", "equalto", "src")|first %}
-Main project structure:
-{% for item in src_structure.children %}
-{% if item.type == 'directory' %}
-- **{{ item.name }}/**{% if item.name.lower() == 'core' %} - main business logic{% 
-elif item.name.lower() == 'models' or item.name.lower() == 'model' %} - data models{% 
-elif item.name.lower() == 'services' %} - services for working with external systems{% 
-elif item.name.lower() == 'utils' or item.name.lower() == 'helpers' %} - utility functions and helpers{% 
-elif item.name.lower() == 'config' %} - project configuration{% 
-elif item.name.lower() == 'controllers' %} - request handlers and controllers{% 
-elif item.name.lower() == 'views' %} - view components{% 
-elif item.name.lower() == 'ui' %} - user interface components{% 
-elif item.name.lower() == 'api' %} - API endpoints{% 
-elif item.name.lower() == 'db' or item.name.lower() == 'database' %} - database interaction{% 
-elif item.name.lower() == 'tests' %} - project tests{% 
-else %} - project component{% endif %}
-
-{% endif %}
-{% endfor %}
-{% else %}
-Key project components:
-{% for item in structure.tree.children %}
-{% if item.type == 'directory' and not item.name.startswith('.') and item.name.lower() not in ['node_modules', '__pycache__', 'venv', 'env', 'bin', 'obj', '.vs', '.vscode', '.idea', 'dist', 'build', 'target'] %}
-- **{{ item.name }}/**{% if item.name.lower() == 'src' %} - source code{% 
-elif item.name.lower() == 'tests' or item.name.lower() == 'test' %} - test suite{% 
-elif item.name.lower() == 'docs' %} - documentation{% 
-elif item.name.lower() == 'config' %} - configuration files{% 
-elif item.name.lower() == 'scripts' %} - utility scripts{% 
-elif item.name.lower() == 'utils' or item.name.lower() == 'helpers' %} - utility functions{% 
-elif item.name.lower() == 'data' %} - data access layer{% 
-elif item.name.lower() == 'domain' %} - domain layer with business logic{% 
-elif item.name.lower() == 'presentation' or item.name.lower() == 'ui' %} - presentation layer{% 
-elif item.name.lower() == 'resources' %} - resource files{% endif %}
-
-{% endif %}
-{% endfor %}
-{% endif %}
-
-{% endif %}
-
-{% if "installation" in sections %}
-## Installation
-
-### Prerequisites
-
-{% if "C#" in technologies|map(attribute="name") or ".NET" in technologies|map(attribute="name") %}
-- .NET SDK (recommended version 6.0 or later)
-- Visual Studio or Visual Studio Code
-{% elif "Java" in technologies|map(attribute="name") %}
-- JDK (recommended version 11 or later)
-- Maven or Gradle build tools
-{% elif "Kotlin" in technologies|map(attribute="name") %}
-- JDK (recommended version 11 or later)
-- Kotlin compiler
-- Maven or Gradle build tools
-{% elif "Python" in technologies|map(attribute="name") %}
-- Python (recommended version 3.8 or later)
-- pip (package manager)
-{% elif "Node.js" in technologies|map(attribute="name") or "JavaScript" in technologies|map(attribute="name") %}
-- Node.js (recommended version 14 or later)
-- npm or yarn package manager
-{% elif "Rust" in technologies|map(attribute="name") %}
-- Rust and Cargo (recommended version 1.56 or later)
-{% elif "Go" in technologies|map(attribute="name") %}
-- Go (recommended version 1.16 or later)
-{% else %}
-{% if technologies|selectattr('category', 'equalto', 'language')|list|length > 0 %}
-- {{ technologies|selectattr('category', 'equalto', 'language')|list|first|attr('name') }}{% if technologies|selectattr('category', 'equalto', 'language')|list|first|attr('version') %} {{ technologies|selectattr('category', 'equalto', 'language')|list|first|attr('version') }}{% endif %}
-{% endif %}
-{% endif %}
-
-{% if technologies|selectattr('category', 'equalto', 'database')|list|length > 0 %}
-- {{ technologies|selectattr('category', 'equalto', 'database')|list|first|attr('name') }}
-{% endif %}
-
-### Setup
-
-1. Clone the repository:
-   ```bash
-   git clone {% if metadata.repository_url %}{{ metadata.repository_url }}{% else %}[repository-url]{% endif %}
-   
-   cd {{ name }}   ```
-
-2. Install dependencies:
-   {% if "Python" in technologies|map(attribute="name") %}
-   ```bash
-   pip install -r requirements.txt
-   ```
-   {% elif "Node.js" in technologies|map(attribute="name") or "JavaScript" in technologies|map(attribute="name") %}
-   ```bash
-   npm install
-   # or
-   yarn install
-   ```
-   {% elif "Rust" in technologies|map(attribute="name") %}
-   ```bash
-   cargo build
-   ```
-   {% elif "Go" in technologies|map(attribute="name") %}
-   ```bash
-   go mod download
-   ```
-   {% elif "C#" in technologies|map(attribute="name") or ".NET" in technologies|map(attribute="name") %}
-   ```bash
-   dotnet restore
-   dotnet build
-   ```
-   {% elif "Java" in technologies|map(attribute="name") %}
-   ```bash
-   # Using Maven
-   mvn clean install
-   
-   # Or using Gradle
-   ./gradlew build
-   ```
-   {% elif "Kotlin" in technologies|map(attribute="name") %}
-   ```bash
-   # Using Maven
-   mvn clean install
-   
-   # Or using Gradle
-   ./gradlew build
-   ```
-   {% else %}
-   ```bash
-   # Install dependencies according to your project's requirements
-   ```
-   {% endif %}
-
-{% if structure.tree.children|selectattr("name", "equalto", "config.json")|list|length > 0 or structure.tree.children|selectattr("name", "equalto", ".env")|list|length > 0 or structure.tree.children|selectattr("name", "equalto", "appsettings.json")|list|length > 0 %}
-3. Configure the application:
-   {% if structure.tree.children|selectattr("name", "equalto", "config.json")|list|length > 0 %}
-   ```bash
-   cp config.example.json config.json
-   # Edit config.json to match your environment
-   ```
-   {% elif structure.tree.children|selectattr("name", "equalto", ".env")|list|length > 0 %}
-   ```bash
-   cp .env.example .env
-   # Edit .env to match your environment
-   ```
-   {% elif structure.tree.children|selectattr("name", "equalto", "appsettings.json")|list|length > 0 %}
-   ```bash
-   # Edit appsettings.json to match your environment
-   ```
-   {% endif %}
-{% endif %}
-
-{% endif %}
-
-{% if "configuration" in sections %}
-## Configuration
-
-{% if structure.tree.children|selectattr("name", "equalto", "config.json")|list|length > 0 %}
-The project is configured through the `config.json` file.
-
-Main parameters:
-- Connection settings
-- Operation parameters
-- File paths and storage locations
-{% elif structure.tree.children|selectattr("name", "equalto", ".env")|list|length > 0 %}
-The project is configured through the `.env` file.
-
-Main environment variables:
-- Connection settings
-- Operation parameters
-- File paths and storage locations
-{% elif structure.tree.children|selectattr("name", "equalto", "appsettings.json")|list|length > 0 %}
-The project is configured through the `appsettings.json` file.
-
-Main settings:
-- Connection strings
-- Application settings
-- Logging configuration
-{% else %}
-The project can be configured through the configuration files according to the platform conventions.
-{% endif %}
-
-{% endif %}
-
-{% if "project_structure" in sections and structure %}
-## Project Structure
-
-```
-{{ name }}/
-{% for item in structure.tree.children recursive %}
-{% if item.type == 'directory' and not item.name.startswith('.') and item.name.lower() not in ['node_modules', '__pycache__', 'venv', 'env', 'bin', 'obj', '.vs', '.vscode', '.idea', 'dist', 'build', 'target'] %}
-├── {{ item.name }}/
-{% for child in item.children %}
-{% if child.type == 'directory' and not child.name.startswith('.') and child.name.lower() not in ['node_modules', '__pycache__', 'venv', 'env', 'bin', 'obj', '.vs', '.vscode', '.idea', 'dist', 'build', 'target'] %}
-    ├── {{ child.name }}/
-{% for grandchild in child.children %}
-{% if grandchild.type == 'directory' and not grandchild.name.startswith('.') and grandchild.name.lower() not in ['node_modules', '__pycache__', 'venv', 'env', 'bin', 'obj', '.vs', '.vscode', '.idea', 'dist', 'build', 'target'] %}
-        ├── {{ grandchild.name }}/
-{% for greatgrandchild in grandchild.children %}
-{% if greatgrandchild.type == 'file' and not greatgrandchild.name.startswith('.') and greatgrandchild.name not in ['__init__.py', 'Thumbs.db', '.DS_Store'] and not greatgrandchild.name.endswith('.pdb') and not greatgrandchild.name.endswith('.dll') and not greatgrandchild.name.endswith('.cache') %}
-            ├── {{ greatgrandchild.name }}
-{% endif %}
-{% endfor %}
-{% elif grandchild.type == 'file' and not grandchild.name.startswith('.') and grandchild.name not in ['__init__.py', 'Thumbs.db', '.DS_Store'] and not grandchild.name.endswith('.pdb') and not grandchild.name.endswith('.dll') and not grandchild.name.endswith('.cache') %}
-        ├── {{ grandchild.name }}
-{% endif %}
-{% endfor %}
-{% elif child.type == 'file' and not child.name.startswith('.') and child.name not in ['__init__.py', 'Thumbs.db', '.DS_Store'] and not child.name.endswith('.pdb') and not child.name.endswith('.dll') and not child.name.endswith('.cache') %}
-    ├── {{ child.name }}
-{% endif %}
-{% endfor %}
-{% elif item.type == 'file' and not item.name.startswith('.') and item.name not in ['__init__.py', 'Thumbs.db', '.DS_Store'] and not item.name.endswith('.pdb') and not item.name.endswith('.dll') and not item.name.endswith('.cache') %}
-├── {{ item.name }}
-{% endif %}
-{% endfor %}
-```
-
-{% endif %}
-
-{% if "usage" in sections %}
-## Usage
-
-{% if "C#" in technologies|map(attribute="name") or ".NET" in technologies|map(attribute="name") %}
-### Running the application
-
-```bash
-dotnet run
-```
-
-{% if features|length > 0 and features[0].name is defined %}
-### {{ features[0].name }}
-
-```csharp
-// Example code for {{ features[0].name|lower }}
-```
-{% endif %}
-
-{% elif "Python" in technologies|map(attribute="name") %}
-### Running the application
-
-```bash
-python main.py
-# or
-python -m {{ name }}
-```
-
-{% if features|length > 0 and features[0].name is defined %}
-### {{ features[0].name }}
-
-```python
-# Example code for {{ features[0].name|lower }}
-```
-{% endif %}
-
-{% elif "Node.js" in technologies|map(attribute="name") or "JavaScript" in technologies|map(attribute="name") %}
-### Running the application
-
-```bash
-npm start
-# or
-node index.js
-```
-
-{% if features|length > 0 and features[0].name is defined %}
-### {{ features[0].name }}
-
-```javascript
-// Example code for {{ features[0].name|lower }}
-```
-{% endif %}
-
-{% elif "Java" in technologies|map(attribute="name") or "Kotlin" in technologies|map(attribute="name") %}
-### Running the application
-
-```bash
-# Using Maven
-mvn exec:java -Dexec.mainClass="com.example.MainClass"
-
-# Or using Gradle
-./gradlew run
-```
-
-{% if features|length > 0 and features[0].name is defined %}
-### {{ features[0].name }}
-
-```java
-// Example code for {{ features[0].name|lower }}
-```
-{% endif %}
-
-{% elif "Rust" in technologies|map(attribute="name") %}
-### Running the application
-
-```bash
-cargo run
-```
-
-{% if features|length > 0 and features[0].name is defined %}
-### {{ features[0].name }}
-
-```rust
-// Example code for {{ features[0].name|lower }}
-```
-{% endif %}
-
-{% elif "Go" in technologies|map(attribute="name") %}
-### Running the application
-
-```bash
-go run main.go
-```
-
-{% if features|length > 0 and features[0].name is defined %}
-### {{ features[0].name }}
-
-```go
-// Example code for {{ features[0].name|lower }}
-```
-{% endif %}
-
-{% else %}
-### Running the application
-
-```bash
-# Run the application according to the project's requirements
-```
-
-{% if features|length > 0 and features[0].name is defined %}
-### {{ features[0].name }}
-
-```
-// Example usage for {{ features[0].name|lower }}
-```
-{% endif %}
-{% endif %}
-
-{% endif %}
-
-{% if "optimization" in sections %}
-## Optimization
-
-{% if features|selectattr("category", "equalto", "file_processing")|list|length > 0 %}
-- File processing optimization
-- Data caching for faster access
-{% elif features|selectattr("category", "equalto", "database")|list|length > 0 %}
-- Database query optimization
-- Index usage for faster lookups
-{% else %}
-- Performance optimization
-- Efficient resource utilization
-{% endif %}
-
-{% endif %}
-
-{% if "contributing" in sections %}
-## Contributing
-
-1. Fork the repository
-2. Create a feature branch (`git checkout -b feature/amazing-feature`)
-3. Make your changes
-4. Commit your changes (`git commit -m 'Add new feature'`)
-5. Push to the branch (`git push origin feature/amazing-feature`)
-6. Open a Pull Request
-
-{% endif %}
-
-{% if "license" in sections %}
-## License
-
-{% if metadata.license_type %}
-This project is licensed under the {{ metadata.license_type }} License
-{% else %}
-This project is licensed under the license specified in the [LICENSE](LICENSE) file in the repository.
-{% endif %}
-{% endif %} 
-"""
-        
-        self.file_repository.save_file(base_path, content)
+        self._copy_default_template("standard")
     
     def _create_minimal_template(self) -> None:
         """Creates a minimal template."""
-        minimal_dir = os.path.join(self.templates_dir, "minimal")
-        os.makedirs(minimal_dir, exist_ok=True)
-        
-        base_path = os.path.join(minimal_dir, "base.md.j2")
-        
-        content = """# {{ name }}
-
-{% if "overview" in sections %}
-## Overview
-
-{{ description }}
-
-{% if name is defined and '_' in name or '-' in name %}
-**{{ name|replace('_', ' ')|replace('-', ' ')|title }}** - {% endif %}{% if features|length > 0 %}a tool for {{ features[0].description|lower }}{% if features|length > 1 %} and {{ features[1].description|lower }}{% endif %}.
-{% else %}
-{% if technologies|selectattr('category', 'equalto', 'language')|list|length > 0 %}
-This project is built with {{ technologies|selectattr('category', 'equalto', 'language')|list|first|attr('name') }}.
-{% endif %}
-{% endif %}
-
-{% if metadata.has_documentation %}
-Documentation is available in the project directory.
-{% endif %}
-{% endif %}
-
-{% if "technologies" in sections %}
-## Technologies
-
-{% if technologies|selectattr('category', 'equalto', 'language')|list|length > 0 %}
-### Programming Languages
-{% for tech in technologies|selectattr('category', 'equalto', 'language')|list %}
-- **{{ tech.name }}**{% if tech.version %} ({{ tech.version }}){% endif %}
-
-{% endfor %}
-{% endif %}
-
-{% if technologies|selectattr('category', 'equalto', 'framework')|list|length > 0 %}
-### Frameworks
-{% for tech in technologies|selectattr('category', 'equalto', 'framework')|list %}
-- **{{ tech.name }}**{% if tech.version %} ({{ tech.version }}){% endif %}
-
-{% endfor %}
-{% endif %}
-
-{% if technologies|selectattr('category', 'equalto', 'frontend')|list|length > 0 or technologies|selectattr('category', 'equalto', 'backend')|list|length > 0 %}
-### Front-end / Back-end
-{% for tech in technologies|selectattr('category', 'equalto', 'frontend')|list %}
-- **{{ tech.name }}** (Front-end){% if tech.version %} ({{ tech.version }}){% endif %}
-
-{% endfor %}
-{% for tech in technologies|selectattr('category', 'equalto', 'backend')|list %}
-- **{{ tech.name }}** (Back-end){% if tech.version %} ({{ tech.version }}){% endif %}
-
-{% endfor %}
-{% endif %}
-
-{% if technologies|selectattr('category', 'equalto', 'database')|list|length > 0 %}
-### Database
-{% for tech in technologies|selectattr('category', 'equalto', 'database')|list %}
-- **{{ tech.name }}**{% if tech.version %} ({{ tech.version }}){% endif %}
-
-{% endfor %}
-{% endif %}
-
-{% if technologies|selectattr('category', 'equalto', 'devops')|list|length > 0 %}
-### DevOps
-{% for tech in technologies|selectattr('category', 'equalto', 'devops')|list %}
-- **{{ tech.name }}**{% if tech.version %} ({{ tech.version }}){% endif %}
-
-{% endfor %}
-{% endif %}
-
-{% if technologies|selectattr('category', 'equalto', 'testing')|list|length > 0 %}
-### Testing
-{% for tech in technologies|selectattr('category', 'equalto', 'testing')|list %}
-- **{{ tech.name }}**{% if tech.version %} ({{ tech.version }}){% endif %}
-
-{% endfor %}
-{% endif %}
-
-{% if technologies|selectattr('category', 'equalto', 'architecture')|list|length > 0 %}
-### Architecture Patterns
-{% for tech in technologies|selectattr('category', 'equalto', 'architecture')|list %}
-- **{{ tech.name }}**{% if tech.version %} ({{ tech.version }}){% endif %}
-
-{% endfor %}
-{% endif %}
-
-{% if technologies|selectattr('category', 'equalto', 'other')|list|length > 0 %}
-### Other
-{% for tech in technologies|selectattr('category', 'equalto', 'other')|list %}
-- **{{ tech.name }}**{% if tech.version %} ({{ tech.version }}){% endif %}
-
-{% endfor %}
-{% endif %}
-{% endif %}
-
-{% if "project_structure" in sections and structure %}
-## Project Structure
-
-```
-{{ name }}/
-{% for item in structure.tree.children recursive %}
-{% if item.type == 'directory' and not item.name.startswith('.') and item.name.lower() not in ['node_modules', '__pycache__', 'venv', 'env', 'bin', 'obj', '.vs', '.vscode', '.idea', 'dist', 'build', 'target'] %}
-├── {{ item.name }}/
-{% for child in item.children %}
-{% if child.type == 'directory' and not child.name.startswith('.') and child.name.lower() not in ['node_modules', '__pycache__', 'venv', 'env', 'bin', 'obj', '.vs', '.vscode', '.idea', 'dist', 'build', 'target'] %}
-    ├── {{ child.name }}/
-{% for grandchild in child.children %}
-{% if grandchild.type == 'directory' and not grandchild.name.startswith('.') and grandchild.name.lower() not in ['node_modules', '__pycache__', 'venv', 'env', 'bin', 'obj', '.vs', '.vscode', '.idea', 'dist', 'build', 'target'] %}
-        ├── {{ grandchild.name }}/
-{% for greatgrandchild in grandchild.children %}
-{% if greatgrandchild.type == 'file' and not greatgrandchild.name.startswith('.') and greatgrandchild.name not in ['__init__.py', 'Thumbs.db', '.DS_Store'] and not greatgrandchild.name.endswith('.pdb') and not greatgrandchild.name.endswith('.dll') and not greatgrandchild.name.endswith('.cache') %}
-            ├── {{ greatgrandchild.name }}
-{% endif %}
-{% endfor %}
-{% elif grandchild.type == 'file' and not grandchild.name.startswith('.') and grandchild.name not in ['__init__.py', 'Thumbs.db', '.DS_Store'] and not grandchild.name.endswith('.pdb') and not grandchild.name.endswith('.dll') and not grandchild.name.endswith('.cache') %}
-        ├── {{ grandchild.name }}
-{% endif %}
-{% endfor %}
-{% elif child.type == 'file' and not child.name.startswith('.') and child.name not in ['__init__.py', 'Thumbs.db', '.DS_Store'] and not child.name.endswith('.pdb') and not child.name.endswith('.dll') and not child.name.endswith('.cache') %}
-    ├── {{ child.name }}
-{% endif %}
-{% endfor %}
-{% elif item.type == 'file' and not item.name.startswith('.') and item.name not in ['__init__.py', 'Thumbs.db', '.DS_Store'] and not item.name.endswith('.pdb') and not item.name.endswith('.dll') and not item.name.endswith('.cache') %}
-├── {{ item.name }}
-{% endif %}
-{% endfor %}
-```
-
-{% endif %}
-
-{% if "installation" in sections %}
-## Installation
-
-1. Clone the repository: `git clone {% if metadata.repository_url %}{{ metadata.repository_url }}{% else %}[repository-url]{% endif %}`
-2. Navigate to the project directory: `cd {{ name }}`
-3. Install dependencies and build the project.
-{% endif %}
-
-{% if "usage" in sections %}
-## Usage
-
-Run the application using the instructions relevant to your project type.
-{% endif %}
-"""
-        
-        self.file_repository.save_file(base_path, content)
+        self._copy_default_template("minimal")
     
     def _create_detailed_template(self) -> None:
         """Creates a detailed template."""
-        detailed_dir = os.path.join(self.templates_dir, "detailed")
-        os.makedirs(detailed_dir, exist_ok=True)
+        self._copy_default_template("detailed")
+    
+    def _copy_default_template(self, template_name: str) -> None:
+        """
+        Copies a default template shipped with the package into the templates directory.
         
-        base_path = os.path.join(detailed_dir, "base.md.j2")
+        An existing template with the same name is left untouched.
         
-        content = """# {{ name }}
-
-## Table of Contents
-
-{% for section in sections %}
-{% if section != "table_of_contents" %}
-- [{{ section|title|replace("_", " ") }}](#{{ section|lower|replace("_", "-") }})
-{% endif %}
-{% endfor %}
-
-{% if "overview" in sections %}
-## Overview
-
-{{ description }}
-
-{% if name is defined and '_' in name or '-' in name %}
-**{{ name|replace('_', ' ')|replace('-', ' ')|title }}** - {% endif %}{% if features|length > 0 %}a tool for {{ features[0].description|lower }}{% if features|length > 1 %} and {{ features[1].description|lower }}{% endif %}.
-{% else %}
-{% if technologies|selectattr('category', 'equalto', 'language')|list|length > 0 %}
-This project is built with {{ technologies|selectattr('category', 'equalto', 'language')|list|first|attr('name') }}.
-{% endif %}
-{% endif %}
-
-{% if metadata.has_documentation %}
-Documentation is available in the project directory.
-{% endif %}
-
-### Target Audience
-
-*Describe the target audience here*
-
-### Key Features
-
-{% if features|length > 0 %}
-{% for feature in features %}
-- {{ feature.name }}: {{ feature.description }}
-{% endfor %}
-{% else %}
-*List key features here*
-{% endif %}
-
-{% endif %}
-
-{% if "features" in sections and features %}
-## Features
-
-{% for feature in features %}
-### {{ feature.name }}
-
-{{ feature.description }}
-
-{% endfor %}
-{% endif %}
-
-{% if "technologies" in sections %}
-## Technologies
-
-{% if technologies %}
-### Development
-
-{% if technologies|selectattr('category', 'equalto', 'language')|list|length > 0 %}
-#### Programming Languages
-{% for tech in technologies|selectattr('category', 'equalto', 'language')|list %}
-- **{{ tech.name }}**{% if tech.version %} ({{ tech.version }}){% endif %}
-
-{% endfor %}
-{% endif %}
-
-{% if technologies|selectattr('category', 'equalto', 'framework')|list|length > 0 %}
-#### Frameworks
-{% for tech in technologies|selectattr('category', 'equalto', 'framework')|list %}
-- **{{ tech.name }}**{% if tech.version %} ({{ tech.version }}){% endif %}
-
-{% endfor %}
-{% endif %}
-
-{% if technologies|selectattr('category', 'equalto', 'frontend')|list|length > 0 or technologies|selectattr('category', 'equalto', 'backend')|list|length > 0 %}
-#### Front-end / Back-end
-{% for tech in technologies|selectattr('category', 'equalto', 'frontend')|list %}
-- **{{ tech.name }}** (Front-end){% if tech.version %} ({{ tech.version }}){% endif %}
-
-{% endfor %}
-{% for tech in technologies|selectattr('category', 'equalto', 'backend')|list %}
-- **{{ tech.name }}** (Back-end){% if tech.version %} ({{ tech.version }}){% endif %}
-
-{% endfor %}
-{% endif %}
-
-{% if technologies|selectattr('category', 'equalto', 'other')|list|length > 0 %}
-#### Other
-{% for tech in technologies|selectattr('category', 'equalto', 'other')|list %}
-- **{{ tech.name }}**{% if tech.version %} ({{ tech.version }}){% endif %}
-
-{% endfor %}
-{% endif %}
-
-### Infrastructure
-
-{% if technologies|selectattr('category', 'equalto', 'database')|list|length > 0 %}
-#### Database
-{% for tech in technologies|selectattr('category', 'equalto', 'database')|list %}
-- **{{ tech.name }}**{% if tech.version %} ({{ tech.version }}){% endif %}
-
-{% endfor %}
-{% endif %}
-
-{% if technologies|selectattr('category', 'equalto', 'devops')|list|length > 0 %}
-#### DevOps
-{% for tech in technologies|selectattr('category', 'equalto', 'devops')|list %}
-- **{{ tech.name }}**{% if tech.version %} ({{ tech.version }}){% endif %}
-
-{% endfor %}
-{% endif %}
-
-### Testing
-
-{% if technologies|selectattr('category', 'equalto', 'testing')|list|length > 0 %}
-{% for tech in technologies|selectattr('category', 'equalto', 'testing')|list %}
-- **{{ tech.name }}**{% if tech.version %} ({{ tech.version }}){% endif %}
-
-{% endfor %}
-{% endif %}
-{% else %}
-*List technologies here*
-{% endif %}
-
-{% endif %}
-
-{% if "architecture" in sections %}
-## Architecture
-
-{% if metadata.architecture_description is defined %}
-{{ metadata.architecture_description }}
-{% else %}
-*Describe the architecture of the project here*
-{% endif %}
-
-{% if technologies|selectattr('category', 'equalto', 'architecture')|list|length > 0 %}
-### Architecture Patterns
-{% for tech in technologies|selectattr('category', 'equalto', 'architecture')|list %}
-- **{{ tech.name }}**{% if tech.version %} ({{ tech.version }}){% endif %}
-
-{% endfor %}
-{% endif %}
-
-{% if structure.tree.children|selectattr("name", "equalto", "src")|list|length > 0 %}
-{% set src_structure = structure.tree.children|selectattr("name", "equalto", "src")|first %}
-### Main Project Components
-{% for item in src_structure.children %}
-{% if item.type == 'directory' %}
-- **{{ item.name }}/**{% if item.name.lower() == 'core' %} - main business logic{% 
-elif item.name.lower() == 'models' or item.name.lower() == 'model' %} - data models{% 
-elif item.name.lower() == 'services' %} - services for working with external systems{% 
-elif item.name.lower() == 'utils' or item.name.lower() == 'helpers' %} - utility functions and helpers{% 
-elif item.name.lower() == 'config' %} - project configuration{% 
-elif item.name.lower() == 'controllers' %} - request handlers and controllers{% 
-elif item.name.lower() == 'views' %} - view components{% 
-elif item.name.lower() == 'ui' %} - user interface components{% 
-elif item.name.lower() == 'api' %} - API endpoints{% 
-elif item.name.lower() == 'db' or item.name.lower() == 'database' %} - database interaction{% 
-elif item.name.lower() == 'tests' %} - project tests{% 
-else %} - project component{% endif %}
-
-{% endif %}
-{% endfor %}
-{% endif %}
-
-{% endif %}
-
-{% if "installation" in sections %}
-## Installation
-
-### Prerequisites
-
-{% if "C#" in technologies|map(attribute="name") or ".NET" in technologies|map(attribute="name") %}
-- .NET SDK (recommended version 6.0 or later)
-- Visual Studio or Visual Studio Code
-{% elif "Java" in technologies|map(attribute="name") %}
-- JDK (recommended version 11 or later)
-- Maven or Gradle build tools
-{% elif "Kotlin" in technologies|map(attribute="name") %}
-- JDK (recommended version 11 or later)
-- Kotlin compiler
-- Maven or Gradle build tools
-{% elif "Python" in technologies|map(attribute="name") %}
-- Python (recommended version 3.8 or later)
-- pip (package manager)
-{% elif "Node.js" in technologies|map(attribute="name") or "JavaScript" in technologies|map(attribute="name") %}
-- Node.js (recommended version 14 or later)
-- npm or yarn package manager
-{% elif "Rust" in technologies|map(attribute="name") %}
-- Rust and Cargo (recommended version 1.56 or later)
-{% elif "Go" in technologies|map(attribute="name") %}
-- Go (recommended version 1.16 or later)
-{% else %}
-{% if technologies|selectattr('category', 'equalto', 'language')|list|length > 0 %}
-- {{ technologies|selectattr('category', 'equalto', 'language')|list|first|attr('name') }}{% if technologies|selectattr('category', 'equalto', 'language')|list|first|attr('version') %} {{ technologies|selectattr('category', 'equalto', 'language')|list|first|attr('version') }}{% endif %}
-{% endif %}
-{% endif %}
-
-{% if technologies|selectattr('category', 'equalto', 'database')|list|length > 0 %}
-- {{ technologies|selectattr('category', 'equalto', 'database')|list|first|attr('name') }}
-{% endif %}
-
-### Setup
-
-1. Clone the repository:
-   ```bash
-   git clone {% if metadata.repository_url %}{{ metadata.repository_url }}{% else %}[repository-url]{% endif %}
-   cd {{ name }}
-   ```
-
-2. Install dependencies:
-   {% if "Python" in technologies|map(attribute="name") %}
-   ```bash
-   pip install -r requirements.txt
-   ```
-   {% elif "Node.js" in technologies|map(attribute="name") or "JavaScript" in technologies|map(attribute="name") %}
-   ```bash
-   npm install
-   # or
-   yarn install
-   ```
-   {% elif "Rust" in technologies|map(attribute="name") %}
-   ```bash
-   cargo build
-   ```
-   {% elif "Go" in technologies|map(attribute="name") %}
-   ```bash
-   go mod download
-   ```
-   {% elif "C#" in technologies|map(attribute="name") or ".NET" in technologies|map(attribute="name") %}
-   ```bash
-   dotnet restore
-   dotnet build
-   ```
-   {% elif "Java" in technologies|map(attribute="name") %}
-   ```bash
-   # Using Maven
-   mvn clean install
-   
-   # Or using Gradle
-   ./gradlew build
-   ```
-   {% elif "Kotlin" in technologies|map(attribute="name") %}
-   ```bash
-   # Using Maven
-   mvn clean install
-   
-   # Or using Gradle
-   ./gradlew build
-   ```
-   {% else %}
-   ```bash
-   # Install dependencies according to your project's requirements
-   ```
-   {% endif %}
-
-{% if structure.tree.children|selectattr("name", "equalto", "config.json")|list|length > 0 or structure.tree.children|selectattr("name", "equalto", ".env")|list|length > 0 or structure.tree.children|selectattr("name", "equalto", "appsettings.json")|list|length > 0 %}
-3. Configure the application:
-   {% if structure.tree.children|selectattr("name", "equalto", "config.json")|list|length > 0 %}
-   ```bash
-   cp config.example.json config.json
-   # Edit config.json to match your environment
-   ```
-   {% elif structure.tree.children|selectattr("name", "equalto", ".env")|list|length > 0 %}
-   ```bash
-   cp .env.example .env
-   # Edit .env to match your environment
-   ```
-   {% elif structure.tree.children|selectattr("name", "equalto", "appsettings.json")|list|length > 0 %}
-   ```bash
-   # Edit appsettings.json to match your environment
-   ```
-   {% endif %}
-{% endif %}
-
-{% endif %}
-
-{% if "configuration" in sections %}
-## Configuration
-
-{% if structure.tree.children|selectattr("name", "equalto", "config.json")|list|length > 0 %}
-The project is configured through the `config.json` file.
-
-### Configuration Parameters
-
-- Connection settings
-- Operation parameters
-- File paths and storage locations
-{% elif structure.tree.children|selectattr("name", "equalto", ".env")|list|length > 0 %}
-The project is configured through the `.env` file.
-
-### Environment Variables
-
-- Connection settings
-- Operation parameters
-- File paths and storage locations
-{% elif structure.tree.children|selectattr("name", "equalto", "appsettings.json")|list|length > 0 %}
-The project is configured through the `appsettings.json` file.
-
-### Configuration Parameters
-
-- Connection strings
-- Application settings
-- Logging configuration
-{% else %}
-The project can be configured through the configuration files according to the platform conventions.
-
-### Configuration Parameters
-
-*Describe configuration parameters here*
-
-### Environment Variables
-
-*List environment variables here*
-{% endif %}
-
-{% endif %}
-
-{% if "project_structure" in sections and structure %}
-## Project Structure
-
-```
-{{ name }}/
-{% for item in structure.tree.children recursive %}
-{% if item.type == 'directory' and not item.name.startswith('.') and item.name.lower() not in ['node_modules', '__pycache__', 'venv', 'env', 'bin', 'obj', '.vs', '.vscode', '.idea', 'dist', 'build', 'target'] %}
-├── {{ item.name }}/
-{% for child in item.children %}
-{% if child.type == 'directory' and not child.name.startswith('.') and child.name.lower() not in ['node_modules', '__pycache__', 'venv', 'env', 'bin', 'obj', '.vs', '.vscode', '.idea', 'dist', 'build', 'target'] %}
-    ├── {{ child.name }}/
-{% for grandchild in child.children %}
-{% if grandchild.type == 'directory' and not grandchild.name.startswith('.') and grandchild.name.lower() not in ['node_modules', '__pycache__', 'venv', 'env', 'bin', 'obj', '.vs', '.vscode', '.idea', 'dist', 'build', 'target'] %}
-        ├── {{ grandchild.name }}/
-{% for greatgrandchild in grandchild.children %}
-{% if greatgrandchild.type == 'file' and not greatgrandchild.name.startswith('.') and greatgrandchild.name not in ['__init__.py', 'Thumbs.db', '.DS_Store'] and not greatgrandchild.name.endswith('.pdb') and not greatgrandchild.name.endswith('.dll') and not greatgrandchild.name.endswith('.cache') %}
-            ├── {{ greatgrandchild.name }}
-{% endif %}
-{% endfor %}
-{% elif grandchild.type == 'file' and not grandchild.name.startswith('.') and grandchild.name not in ['__init__.py', 'Thumbs.db', '.DS_Store'] and not grandchild.name.endswith('.pdb') and not grandchild.name.endswith('.dll') and not grandchild.name.endswith('.cache') %}
-        ├── {{ grandchild.name }}
-{% endif %}
-{% endfor %}
-{% elif child.type == 'file' and not child.name.startswith('.') and child.name not in ['__init__.py', 'Thumbs.db', '.DS_Store'] and not child.name.endswith('.pdb') and not child.name.endswith('.dll') and not child.name.endswith('.cache') %}
-    ├── {{ child.name }}
-{% endif %}
-{% endfor %}
-{% elif item.type == 'file' and not item.name.startswith('.') and item.name not in ['__init__.py', 'Thumbs.db', '.DS_Store'] and not item.name.endswith('.pdb') and not item.name.endswith('.dll') and not item.name.endswith('.cache') %}
-├── {{ item.name }}
-{% endif %}
-{% endfor %}
-```
-
-### Key Components
-
-{% if structure.tree.children|selectattr("name", "equalto", "src")|list|length > 0 %}
-{% set src_structure = structure.tree.children|selectattr("name", "equalto", "src")|first %}
-{% for item in src_structure.children %}
-{% if item.type == 'directory' %}
-- **{{ item.name }}/**{% if item.name.lower() == 'core' %} - Core business logic{% 
-elif item.name.lower() == 'models' or item.name.lower() == 'model' %} - Data models and entities{% 
-elif item.name.lower() == 'services' %} - Services for working with external systems{% 
-elif item.name.lower() == 'utils' or item.name.lower() == 'helpers' %} - Utility functions and helpers{% 
-elif item.name.lower() == 'config' %} - Project configuration{% 
-elif item.name.lower() == 'controllers' %} - Request handlers and controllers{% 
-elif item.name.lower() == 'views' %} - View components{% 
-elif item.name.lower() == 'ui' %} - User interface components{% 
-elif item.name.lower() == 'api' %} - API endpoints{% 
-elif item.name.lower() == 'db' or item.name.lower() == 'database' %} - Database interaction{% 
-elif item.name.lower() == 'tests' %} - Project tests{% 
-else %} - Project component{% endif %}
-
-{% endif %}
-{% endfor %}
-{% else %}
-*Describe key components here*
-{% endif %}
-
-{% endif %}
-
-{% if "api_documentation" in sections %}
-## API Documentation
-
-{% if "Node.js" in technologies|map(attribute="name") or "JavaScript" in technologies|map(attribute="name") %}
-### REST API Endpoints
-
-| Endpoint | Method | Description |
-|----------|--------|-------------|
-| `/api/resource` | GET | Retrieve resources |
-| `/api/resource/:id` | GET | Retrieve a specific resource |
-| `/api/resource` | POST | Create a new resource |
-| `/api/resource/:id` | PUT | Update a specific resource |
-| `/api/resource/:id` | DELETE | Delete a specific resource |
-
-### Request and Response Examples
-
-#### Get Resources
-
-```
-GET /api/resource
-```
-
-Response:
-```json
-[
-  {
-    "id": 1,
-    "name": "Resource Name",
-    "description": "Resource description"
-  }
-]
-```
-{% else %}
-*Document API endpoints here*
-{% endif %}
-
-{% endif %}
-
-{% if "testing" in sections %}
-## Testing
-
-{% if "Python" in technologies|map(attribute="name") %}
-### Running Tests
-
-```bash
-pytest
-```
-
-### Test Coverage
-
-```bash
-pytest --cov=src
-```
-{% elif "Node.js" in technologies|map(attribute="name") or "JavaScript" in technologies|map(attribute="name") %}
-### Running Tests
-
-```bash
-npm test
-```
-
-### Test Coverage
-
-```bash
-npm run test:coverage
-```
-{% else %}
-*Describe testing approach and how to run tests*
-{% endif %}
-
-{% endif %}
-
-{% if "deployment" in sections %}
-## Deployment
-
-{% if "Docker" in technologies|map(attribute="name") %}
-### Docker Deployment
-
-```bash
-docker build -t {{ name|lower }} .
-docker run -p 8080:8080 {{ name|lower }}
-```
-{% else %}
-*Describe deployment process and environments*
-{% endif %}
-
-{% endif %}
-
-{% if "optimization" in sections %}
-## Optimization
-
-*Describe optimization strategies and performance considerations*
-
-{% endif %}
-
-{% if "roadmap" in sections %}
-## Roadmap
-
-*List planned features and improvements*
-
-{% endif %}
-
-{% if "contributing" in sections %}
-## Contributing
-
-1. Fork the repository
-2. Create a feature branch (`git checkout -b feature/amazing-feature`)
-3. Make your changes
-4. Commit your changes (`git commit -m 'Add some amazing feature'`)
-5. Push to the branch (`git push origin feature/amazing-feature`)
-6. Submit a Pull Request
-
-Please make sure your code follows the project's coding standards and includes appropriate tests.
-
-{% endif %}
-
-{% if "license" in sections %}
-## License
-
-{% if metadata.license_type %}
-This project is licensed under the {{ metadata.license_type }} License - see the LICENSE file for details.
-{% else %}
-This project is licensed under the [LICENSE](LICENSE) file in the repository.
-{% endif %}
-{% endif %}
-
-{% if "acknowledgements" in sections %}
-## Acknowledgements
-
-*List acknowledgements here*
-
-{% endif %}
-"""
+        Args:
+            template_name: The name of the template
+        """
+        base_path = os.path.join(self.templates_dir, template_name, "base.md.j2")
+        if self.file_repository.file_exists(base_path):
+            return
         
-        self.file_repository.save_file(base_path, content)
\ No newline at end of file
+        source_path = str(DEFAULT_TEMPLATES_DIR / template_name / "base.md.j2")
+        self.file_repository.save_file(base_path, self.file_repository.read_file(source_path))
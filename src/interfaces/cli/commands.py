@@ -1,28 +1,48 @@
 """Module with CLI commands for ReadmeForge."""
 import os
-import click
-from typing import Optional, List
+import sys
+import stat
+import argparse
+from typing import TYPE_CHECKING, Callable, Optional, List
 
-from ...domain.usecases.generate_readme import ReadmeGeneratorUseCase
+if TYPE_CHECKING:
+    from ...domain.usecases.generate_readme import ReadmeGeneratorUseCase
 
 
 class CLIHandler:
     """CLI commands handler."""
     
-    def __init__(self, readme_generator: ReadmeGeneratorUseCase):
+    def __init__(self, generator_factory: Callable[..., "ReadmeGeneratorUseCase"],
+                 cache_cleaner: Optional[Callable[[], int]] = None):
         """
         Initialization of the CLI handler.
         
+        The use case is created on first use, so commands that do not generate
+        a README never import or set up the analyzers and the template renderer.
+        
         Args:
-            readme_generator: Use case for generating README
+            generator_factory: Function that creates the use case for generating README;
+                it accepts a use_cache keyword that enables cached project analysis
+            cache_cleaner: Function that clears the caches and returns the number
+                of removed entries
         """
-        self.readme_generator = readme_generator
+        self.generator_factory = generator_factory
+        self.cache_cleaner = cache_cleaner
+        self._readme_generator = None
+    
+    @property
+    def readme_generator(self) -> "ReadmeGeneratorUseCase":
+        """Use case for generating README, created on first access."""
+        if self._readme_generator is None:
+            self._readme_generator = self.generator_factory()
+        return self._readme_generator
     
     def generate(self, 
                  project_path: str, 
                  output_path: Optional[str] = None,
                  template_name: str = "standard",
-                 sections: Optional[List[str]] = None) -> None:
+                 sections: Optional[List[str]] = None,
+                 use_cache: bool = True) -> None:
         """
         Generates a README.md file for the specified project.
         
@@ -31,59 +51,161 @@ class CLIHandler:
             output_path: The path to save the README (default - project root)
             template_name: The name of the template for generation
             sections: A list of sections to include
+            use_cache: Whether a cached analysis of an unchanged project may be reused
+        
+        Raises:
+            SystemExit: If the project path does not exist or is not a directory
         """
-        if not os.path.isabs(project_path):
-            project_path = os.path.abspath(project_path)
+        self._validate_project_path(project_path)
+        project_path = os.path.abspath(project_path)
         
-        result_path = self.readme_generator.execute(
+        readme_generator = self.readme_generator if use_cache else self.generator_factory(use_cache=False)
+        result_path = readme_generator.execute(
             project_path=project_path,
             output_path=output_path,
             template_name=template_name,
             section_names=sections
         )
         
-        click.echo(f"README.md successfully generated: {result_path}")
+        sys.stdout.write(f"README.md successfully generated: {result_path}\n")
+    
+    def _validate_project_path(self, project_path: str) -> None:
+        """
+        Checks that the project path is an existing directory with a single stat call.
+        
+        Args:
+            project_path: The path to the project
+        
+        Raises:
+            SystemExit: If the path does not exist or is not a directory
+        """
+        try:
+            mode = os.stat(project_path).st_mode
+        except OSError:
+            error = f"Directory '{project_path}' does not exist."
+        else:
+            if stat.S_ISDIR(mode):
+                return
+            error = f"Directory '{project_path}' is a file."
+        
+        sys.stderr.write(f"Error: Invalid value for 'PROJECT_PATH': {error}\n")
+        raise SystemExit(2)
+    
+    def clear_cache(self) -> None:
+        """Clears the compiled template and project analysis caches."""
+        if self.cache_cleaner is None:
+            sys.stdout.write("No cache is configured\n")
+            return
+        
+        removed = self.cache_cleaner()
+        sys.stdout.write(f"Cache cleared: {removed} file(s) removed\n")
 
 
-@click.group()
-def cli():
-    """Utility for generating README.md files based on project structure."""
-    pass
+TEMPLATE_CHOICES = ["standard", "minimal", "detailed"]
 
 
-def setup_cli_commands(cli_handler: CLIHandler) -> None:
+def _file_path(value: str) -> str:
+    """
+    Validates that a command-line argument does not point to a directory.
+    
+    Args:
+        value: The argument value
+    
+    Returns:
+        str: The argument value
+    
+    Raises:
+        argparse.ArgumentTypeError: If the path is an existing directory
+    """
+    if os.path.isdir(value):
+        raise argparse.ArgumentTypeError(f"File '{value}' is a directory.")
+    return value
+
+
+def cli(parser: argparse.ArgumentParser, argv: Optional[List[str]] = None) -> None:
+    """
+    Utility for generating README.md files based on project structure.
+    
+    Args:
+        parser: The parser created by setup_cli_commands
+        argv: The command-line arguments (if None, sys.argv is used)
+    """
+    args = parser.parse_args(argv)
+    handler = getattr(args, "handler", None)
+    if handler is None:
+        parser = getattr(args, "parser", parser)
+        parser.print_help()
+        return
+    handler(args)
+
+
+def setup_cli_commands(cli_handler: CLIHandler) -> argparse.ArgumentParser:
     """
     Sets up CLI commands.
     
+    A new parser is built on every call, so the commands can be set up again
+    in the same process.
+    
     Args:
         cli_handler: CLI commands handler
+    
+    Returns:
+        argparse.ArgumentParser: The parser with the commands registered
     """
+    parser = argparse.ArgumentParser(
+        description="Utility for generating README.md files based on project structure."
+    )
+    subparsers = parser.add_subparsers(dest="command", metavar="COMMAND")
     
-    @cli.command("generate")
-    @click.argument("project_path", type=click.Path(exists=True, file_okay=False, dir_okay=True))
-    @click.option(
+    generate_parser = subparsers.add_parser(
+        "generate",
+        help="Generates a README.md file for the specified project.",
+        description="Generates a README.md file for the specified project."
+    )
+    generate_parser.add_argument("project_path", help="The path to the project directory")
+    generate_parser.add_argument(
         "--output", "-o",
         help="The path to save the README.md file",
-        type=click.Path(dir_okay=False)
+        type=_file_path
     )
-    @click.option(
+    generate_parser.add_argument(
         "--template", "-t",
         help="The name of the template (standard, minimal, detailed)",
-        type=click.Choice(["standard", "minimal", "detailed"]),
+        type=str.lower,
+        choices=TEMPLATE_CHOICES,
         default="standard"
     )
-    @click.option(
+    generate_parser.add_argument(
         "--section", "-s",
         help="The section to include (can be specified multiple times)",
-        type=str,
-        multiple=True
+        action="append"
     )
-    def generate_readme(project_path: str, output: Optional[str], template: str, section: List[str]) -> None:
-        """Generates a README.md file for the specified project."""
-        sections = list(section) if section else None
-        cli_handler.generate(
-            project_path=project_path,
-            output_path=output,
-            template_name=template,
-            sections=sections
-        ) 
\ No newline at end of file
+    generate_parser.add_argument(
+        "--no-cache",
+        help="Analyze the project from scratch instead of reusing a cached analysis",
+        dest="use_cache",
+        action="store_false"
+    )
+    generate_parser.set_defaults(handler=lambda args: cli_handler.generate(
+        project_path=args.project_path,
+        output_path=args.output,
+        template_name=args.template,
+        sections=args.section,
+        use_cache=args.use_cache
+    ))
+    
+    cache_parser = subparsers.add_parser(
+        "cache",
+        help="Manages the template and project analysis caches.",
+        description="Manages the template and project analysis caches."
+    )
+    cache_parser.set_defaults(parser=cache_parser)
+    cache_subparsers = cache_parser.add_subparsers(dest="cache_command", metavar="COMMAND")
+    clear_parser = cache_subparsers.add_parser(
+        "clear",
+        help="Deletes the compiled templates and cached project analyses.",
+        description="Deletes the compiled templates and cached project analyses."
+    )
+    clear_parser.set_defaults(handler=lambda args: cli_handler.clear_cache())
+    
+    return parser
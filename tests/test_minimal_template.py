@@ -0,0 +1,120 @@
+"""Parity tests for the Python renderer of the shipped minimal template."""
+import os
+import hashlib
+import unittest
+
+os.environ["READMEFORGE_JINJA_CACHE"] = "0"
+
+from src.domain.entities.project import Project, Technology, Feature
+from src.infrastructure.repositories.file_repository import FileRepository
+from src.infrastructure.repositories.config_repository import ConfigRepository
+from src.infrastructure.templates.template_renderer import (
+    DEFAULT_TEMPLATES_DIR, MINIMAL_TEMPLATE_DIGEST, TemplateRenderer, _render_minimal
+)
+
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config.json")
+
+TREE = {
+    "name": "my-app",
+    "type": "directory",
+    "children": [
+        {"name": "src", "type": "directory", "children": [
+            {"name": "core", "type": "directory", "children": [{"name": "engine.py", "type": "file"}]},
+            {"name": "main.py", "type": "file"}
+        ]},
+        {"name": "node_modules", "type": "directory", "children": []},
+        {"name": ".env", "type": "file"},
+        {"name": "README.md", "type": "file"}
+    ]
+}
+
+PROJECTS = [
+    Project(
+        name="my-app",
+        path="/tmp/my-app",
+        description="A sample application",
+        technologies=[
+            Technology("Python", "language", "3.11", 3),
+            Technology("JavaScript", "language"),
+            Technology("Flask", "framework", "2.0"),
+            Technology("React", "frontend", "18"),
+            Technology("Express.js", "backend"),
+            Technology("PostgreSQL", "database"),
+            Technology("Docker", "devops"),
+            Technology("PyTest", "testing"),
+            Technology("MVC Architecture", "architecture"),
+            Technology("Documentation", "other")
+        ],
+        features=[
+            Feature("web", "Provides a web interface", "web"),
+            Feature("api", "Provides an API", "api")
+        ],
+        structure={"tree": TREE},
+        metadata={"has_documentation": True, "repository_url": "https://example.com/my-app.git"}
+    ),
+    Project(
+        name="tool",
+        path="/tmp/tool",
+        description="",
+        technologies=[Technology("Go", "language"), Technology("gRPC", "backend", "1.5")],
+        features=[Feature("cli", "Command-line interface", "cli")],
+        structure={"tree": {"name": "tool", "type": "directory", "children": []}},
+        metadata={}
+    ),
+    Project(
+        name="empty_project",
+        path="/tmp/empty_project",
+        technologies=[Technology("Rust", "language")]
+    ),
+    Project(name="bare", path="/tmp/bare")
+]
+
+SECTION_SETS = [
+    None,
+    [],
+    ["overview"],
+    ["technologies", "installation"],
+    ["project_structure", "usage"],
+    ["usage", "project_structure", "technologies", "overview", "installation"]
+]
+
+
+class MinimalTemplateParityTest(unittest.TestCase):
+    """Checks that the Python renderer matches minimal/base.md.j2."""
+
+    @classmethod
+    def setUpClass(cls):
+        file_repository = FileRepository()
+        config_repository = ConfigRepository(CONFIG_PATH, file_repository)
+        cls.renderer = TemplateRenderer(str(DEFAULT_TEMPLATES_DIR), file_repository, config_repository)
+
+    def test_digest_matches_shipped_template(self):
+        with open(DEFAULT_TEMPLATES_DIR / "minimal" / "base.md.j2", encoding="utf-8") as file:
+            source = file.read()
+        digest = hashlib.blake2b(source.encode("utf-8"), digest_size=16).hexdigest()
+        self.assertEqual(digest, MINIMAL_TEMPLATE_DIGEST)
+        self.assertTrue(self.renderer._use_minimal_fast_path())
+
+    def test_python_renderer_matches_jinja(self):
+        template = self.renderer._get_template("minimal")
+        for project in PROJECTS:
+            for sections in SECTION_SETS:
+                with self.subTest(project=project.name, sections=sections):
+                    if sections is None:
+                        sections = self.renderer.get_sections_for_template("minimal")
+                    context = self.renderer._build_context(project.to_dict(), sections)
+                    self.assertEqual(_render_minimal(context), template.render(**context))
+
+    def test_render_uses_python_renderer_output(self):
+        project = PROJECTS[0]
+        sections = self.renderer.get_sections_for_template("minimal")
+        expected = self.renderer._get_template("minimal").render(
+            **self.renderer._build_context(project.to_dict(), sections)
+        )
+        self.assertEqual(self.renderer.render("minimal", project.to_dict()), expected)
+        self.assertEqual("".join(self.renderer.render_stream("minimal", project.to_dict())), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()